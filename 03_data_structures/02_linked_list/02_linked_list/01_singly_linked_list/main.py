@@ -1,4 +1,11 @@
+import gc
+import time
+import tracemalloc
+from random import Random, random, randrange
+
+
 class Node:
+    __slots__ = ('data', 'next')
     def __init__(self, data=None):
         self.data = data
         self.next = None
@@ -10,6 +17,15 @@ class Node:
             current = current.next
             yield val
 
+# Node used when the list also tracks predecessors (track_prev=True),
+# which makes removing the tail an O(1) operation.
+class BackLinkedNode(Node):
+    __slots__ = ('prev',)
+    def __init__(self, data=None):
+        super().__init__(data)
+        self.prev = None
+
+
 # n1 : Node = Node('eggs')
 # n2 : Node = Node('ham')
 # n3 : Node = Node('spam')
@@ -23,22 +39,288 @@ class Node:
 #     print(value)
 
 
+# Node used by the unrolled backend: one node holds up to `chunk_size`
+# items in a plain list instead of one item per Node object.
+class UnrolledNode:
+    __slots__ = ('items', 'next', 'prev')
+    def __init__(self, next=None, prev=None):
+        self.items = []
+        self.next = next
+        self.prev = prev
+
+
+# Skip-list overlay used by the indexed mode of SinglyLinkedList.
+# Each tower sits on top of one list node and links forward to the next
+# tower on every level it has; width[lvl] counts how many nodes that link
+# jumps over, which is what lets us find a position in O(log n).
+MAX_SKIP_LEVEL = 32
+SKIP_PROBABILITY = 0.5
+
+
+class SkipTower:
+    __slots__ = ('node', 'next', 'width')
+    def __init__(self, node, height):
+        self.node = node
+        self.next = [None] * height
+        self.width = [0] * height
+
+
+def merge_chains(a, b, keys=None, reverse=False):
+    """Merge two sorted chains of nodes by relinking them.
+
+    On ties the node from `a` comes first, which keeps the sort stable.
+    """
+    dummy = tail = Node()
+    while a and b:
+        if keys is None:
+            key_a, key_b = a.data, b.data
+        else:
+            key_a, key_b = keys[a], keys[b]
+        if (key_a < key_b) if reverse else (key_b < key_a):
+            tail.next = b
+            tail = b
+            b = b.next
+        else:
+            tail.next = a
+            tail = a
+            a = a.next
+    tail.next = a or b
+    return dummy.next
+
+
+def merge_sort_chain(head, keys=None, reverse=False):
+    """Bottom-up merge sort of a node chain; returns the new head.
+
+    bins[i] holds a sorted run of 2**i nodes (or None). Each node is merged
+    up through the bins like a carry in binary addition, so no node is
+    allocated and nothing is copied into a Python list.
+    """
+    bins = []
+    current = head
+    while current:
+        carry = current
+        current = current.next
+        carry.next = None
+        i = 0
+        while i < len(bins) and bins[i] is not None:
+            carry = merge_chains(bins[i], carry, keys, reverse)
+            bins[i] = None
+            i += 1
+        if i == len(bins):
+            bins.append(carry)
+        else:
+            bins[i] = carry
+    result = None
+    for run in bins:
+        if run is not None:
+            # Higher bins hold earlier nodes, so they go first on ties.
+            result = merge_chains(run, result, keys, reverse)
+    return result
+
+
+def random_tower_height():
+    height = 0
+    while height < MAX_SKIP_LEVEL and random() < SKIP_PROBABILITY:
+        height += 1
+    return height
+
+
 class SinglyLinkedList:
-    def __init__(self):
+    def __init__(self, indexed=False, chunk_size=None, track_prev=False,
+                 value_index=False):
+        if indexed and chunk_size:
+            raise ValueError("indexed mode needs one node per item")
+        if value_index and chunk_size:
+            raise ValueError("value index needs one node per item")
         self.tail = None
         self.head = None
         self.size = 0
+        self.chunk_size = chunk_size
+        # Unlinking a node found through the value index needs its
+        # predecessor, so the value index implies back pointers.
+        self.track_prev = track_prev or value_index
+        self.value_index = value_index
+        self._nodes_by_value = {}
+        self.indexed = indexed
+        if indexed:
+            self.build_index()
+
+    # Value index: data -> node, or data -> [nodes] once a value is
+    # duplicated. Each list is kept in list order, so search() returns the
+    # same node a scan from head would find.
+    def _remember(self, node):
+        # For a node that is the last of its value in the list.
+        if self.value_index:
+            nodes = self._nodes_by_value.get(node.data)
+            if nodes is None:
+                self._nodes_by_value[node.data] = node
+            elif type(nodes) is list:
+                nodes.append(node)
+            else:
+                self._nodes_by_value[node.data] = [nodes, node]
+
+    def _remember_inserted(self, node):
+        # For a node already linked in anywhere: walk out from it both ways
+        # until an equal node or an end of the list shows its place.
+        if not self.value_index:
+            return
+        data = node.data
+        nodes = self._nodes_by_value.get(data)
+        if nodes is None:
+            self._nodes_by_value[data] = node
+            return
+        if type(nodes) is not list:
+            nodes = self._nodes_by_value[data] = [nodes]
+        before, after = node.prev, node.next
+        while True:
+            if after is None:
+                nodes.append(node)
+                return
+            if before is None:
+                nodes.insert(0, node)
+                return
+            if after.data == data:
+                nodes.insert(nodes.index(after), node)
+                return
+            if before.data == data:
+                nodes.insert(nodes.index(before) + 1, node)
+                return
+            before, after = before.prev, after.next
+
+    def _forget(self, node):
+        if self.value_index:
+            nodes = self._nodes_by_value[node.data]
+            if nodes is node:
+                del self._nodes_by_value[node.data]
+                return
+            if nodes[-1] is node:
+                nodes.pop()
+            elif nodes[0] is node:
+                del nodes[0]
+            else:
+                nodes.remove(node)
+            if len(nodes) == 1:
+                self._nodes_by_value[node.data] = nodes[0]
+
+    def _rebuild_value_index(self):
+        self._nodes_by_value = {}
+        current = self.head
+        while current:
+            self._remember(current)
+            current = current.next
+
+    def _new_node(self, data):
+        if self.track_prev:
+            return BackLinkedNode(data)
+        return Node(data)
+
+    def _relink_prev(self):
+        prev = None
+        current = self.head
+        while current:
+            current.prev = prev
+            prev = current
+            current = current.next
+
+    # Unrolled backend: positions are 0-based, as in __getitem__.
+
+    def _chunk_at(self, index):
+        # The chunk holding position `index` and the offset inside it.
+        current = self.head
+        while index >= len(current.items):
+            index -= len(current.items)
+            current = current.next
+        return current, index
+
+    def _split_chunk(self, chunk, offset):
+        # Move chunk.items[offset:] into a new chunk right after it.
+        cut = UnrolledNode(next=chunk.next, prev=chunk)
+        cut.items = chunk.items[offset:]
+        del chunk.items[offset:]
+        if chunk.next:
+            chunk.next.prev = cut
+        else:
+            self.tail = cut
+        chunk.next = cut
+        return cut
+
+    def _chunk_insert(self, index, data):
+        if index == self.size:
+            self.append(data)
+            return
+        chunk, offset = self._chunk_at(index)
+        chunk.items.insert(offset, data)
+        self.size += 1
+        if len(chunk.items) > self.chunk_size:
+            self._split_chunk(chunk, len(chunk.items) // 2)
+
+    def _chunk_remove(self, chunk, offset):
+        data = chunk.items.pop(offset)
+        if not chunk.items:
+            if chunk.prev:
+                chunk.prev.next = chunk.next
+            else:
+                self.head = chunk.next
+            if chunk.next:
+                chunk.next.prev = chunk.prev
+            else:
+                self.tail = chunk.prev
+        self.size -= 1
+        return data
+
+    def _chunk_insert_before_match(self, data):
+        chunk = self.head
+        while chunk:
+            if data in chunk.items:
+                chunk.items.insert(chunk.items.index(data), data)
+                self.size += 1
+                if len(chunk.items) > self.chunk_size:
+                    self._split_chunk(chunk, len(chunk.items) // 2)
+                return
+            chunk = chunk.next
+
+    def __len__(self):
+        return self.size
+
+    @classmethod
+    def from_iterable(cls, iterable, **options):
+        words = cls(**options)
+        words.extend(iterable)
+        return words
 
     def iter(self):
         """Yield each data item in the list."""
         current = self.head
+        if self.chunk_size:
+            while current:
+                yield from current.items
+                current = current.next
+            return
         while current:
             yield current.data
             current = current.next
 
     def append(self, data):
-        node = Node(data=data)
+        if self.chunk_size:
+            tail = self.tail
+            if tail is None or len(tail.items) >= self.chunk_size:
+                tail = UnrolledNode(prev=self.tail)
+                if self.tail:
+                    self.tail.next = tail
+                else:
+                    self.head = tail
+                self.tail = tail
+            tail.items.append(data)
+            self.size += 1
+            return
+        node = self._new_node(data)
+        if self.indexed:
+            self._index_insert(self.size, node)
+            return
+        self._remember(node)
         if self.tail:
+            if self.track_prev:
+                node.prev = self.tail
             self.tail.next = node
             self.tail = node
             self.size += 1
@@ -52,14 +334,31 @@ class SinglyLinkedList:
             print('Index should be greater than 1')
             return
 
-        node = Node(data)
+        if self.chunk_size:
+            if index > self.size + 1:
+                print("The list has fewer than {} elements".format(index))
+                return
+            self._chunk_insert(index - 1, data)
+            return
+
+        node = self._new_node(data)
+
+        if self.indexed:
+            if index > self.size + 1:
+                print("The list has fewer than {} elements".format(index))
+                return
+            self._index_insert(index - 1, node)
+            return
 
         # Case 1: Insert at head
         if index == 1:
             node.next = self.head
+            if self.head and self.track_prev:
+                self.head.prev = node
             self.head = node
             if self.tail is None:  # if list was empty
                 self.tail = node
+            self._remember_inserted(node)
             self.size += 1
             return
 
@@ -72,6 +371,10 @@ class SinglyLinkedList:
             if count == index:
                 prev.next = node
                 node.next = current
+                if self.track_prev:
+                    node.prev = prev
+                    current.prev = node
+                self._remember_inserted(node)
                 self.size += 1
                 return
             prev = current
@@ -80,25 +383,61 @@ class SinglyLinkedList:
 
         # Case 3: If inserting at the end (index == size + 1)
         if count == index:
+            self._remember(node)
             prev.next = node
+            if self.track_prev:
+                node.prev = prev
             self.tail = node
             self.size += 1
         else:
             print("The list has fewer than {} elements".format(index))
 
     def append_with_same_data(self, data):
+        """Insert data once, in front of the first item equal to it."""
+        if self.chunk_size:
+            self._chunk_insert_before_match(data)
+            return
         current = self.head
-        prev = self.head
-        node = Node(data)
-        while current:
-            if current.data == data:
-                node.next = current
-                prev.next = node
+        prev = None
+        position = 0
+        while current and current.data != data:
             prev = current
             current = current.next
+            position += 1
+        if current is None:
+            return
+        node = self._new_node(data)
+        if self.indexed:
+            self._index_insert(position, node)
+            return
+        node.next = current
+        if prev is None:
+            self.head = node
+        else:
+            prev.next = node
+        if self.track_prev:
+            node.prev = prev
+            current.prev = node
+        self._remember_inserted(node)
+        self.size += 1
+
+    def __contains__(self, data):
+        return self.search(data) is not None
 
     def search(self, data):
+        if self.value_index:
+            nodes = self._nodes_by_value.get(data)
+            if type(nodes) is list:
+                return nodes[0]
+            return nodes
         current = self.head
+        if self.chunk_size:
+            # Returns the chunk node that holds the item.
+            while current:
+                if data in current.items:
+                    return current
+                current = current.next
+            return None
         while current:
             if current.data == data:
                 return current
@@ -109,11 +448,26 @@ class SinglyLinkedList:
         if self.head is None:
             print("List is empty. Nothing to delete.")
             return
+        if self.indexed:
+            return self._index_delete(0).data
+        if self.chunk_size:
+            deleted_data = self.head.items.pop(0)
+            if not self.head.items:
+                self.head = self.head.next
+                if self.head is None:
+                    self.tail = None
+                else:
+                    self.head.prev = None
+            self.size -= 1
+            return deleted_data
         node_to_delete = self.head
         deleted_data = node_to_delete.data
+        self._forget(node_to_delete)
         self.head = self.head.next
         if self.head is None:
             self.tail = None
+        elif self.track_prev:
+            self.head.prev = None
         self.size -= 1
         return deleted_data
 
@@ -121,10 +475,34 @@ class SinglyLinkedList:
         if self.head is None:
             print("List is empty. Nothing to delete.")
             return
+        if self.indexed:
+            return self._index_delete(self.size - 1).data
+        if self.chunk_size:
+            deleted_data = self.tail.items.pop()
+            if not self.tail.items:
+                if self.head is self.tail:
+                    self.head = self.tail = None
+                else:
+                    self.tail = self.tail.prev
+                    self.tail.next = None
+            self.size -= 1
+            return deleted_data
+        if self.track_prev:
+            # O(1): the predecessor is already known.
+            deleted_data = self.tail.data
+            self._forget(self.tail)
+            self.tail = self.tail.prev
+            if self.tail is None:
+                self.head = None
+            else:
+                self.tail.next = None
+            self.size -= 1
+            return deleted_data
         current = self.head
         prev = None
         if current.next is None:
             deleted_data = current.data
+            self._forget(current)
             self.head = None
             self.tail = None
             self.size -= 1
@@ -135,12 +513,43 @@ class SinglyLinkedList:
             current = current.next
 
         deleted_data = current.data
+        self._forget(current)
         prev.next = None
         self.tail = prev
         self.size -= 1
         return deleted_data
 
     def delete_at_a_location(self, data):
+        if self.chunk_size:
+            # Returns the chunk node the item was removed from, as search()
+            # returns the chunk node that holds it.
+            chunk = self.search(data)
+            if chunk is not None:
+                self._chunk_remove(chunk, chunk.items.index(data))
+            return chunk
+        if self.indexed:
+            position = 0
+            for value in self.iter():
+                if value == data:
+                    return self._index_delete(position)
+                position += 1
+            return None
+        if self.value_index:
+            node = self.search(data)
+            if node is None:
+                return None
+            prev = node.prev
+            if prev is None:
+                self.head = node.next
+            else:
+                prev.next = node.next
+            if node.next is None:
+                self.tail = prev
+            else:
+                node.next.prev = prev
+            self._forget(node)
+            self.size -= 1
+            return node
         current = self.head
         prev = None
         while current:
@@ -151,6 +560,8 @@ class SinglyLinkedList:
                     prev.next = current.next
                 if current.next is None:
                     self.tail = prev
+                elif self.track_prev:
+                    current.next.prev = prev
                 self.size -= 1
                 return current
             prev = current
@@ -161,6 +572,737 @@ class SinglyLinkedList:
         self.head = None
         self.tail = None
         self.size = 0
+        self._nodes_by_value = {}
+        if self.indexed:
+            self.build_index()
+
+    # ---------------------------------------------------------------------
+    # Bulk loading. The new nodes are linked in a tight loop and head, tail
+    # and size are fixed up once, after the loop.
+
+    def _link_chain(self, iterable):
+        dummy = last = self._new_node(None)
+        count = 0
+        if self.track_prev:
+            for count, data in enumerate(iterable, 1):
+                node = BackLinkedNode(data)
+                node.prev = last
+                last.next = node
+                last = node
+        else:
+            for count, data in enumerate(iterable, 1):
+                node = Node(data)
+                last.next = node
+                last = node
+        first = dummy.next
+        if first is not None and self.track_prev:
+            first.prev = None
+        return first, last, count
+
+    def _link_chain_reversed(self, iterable):
+        # Each item goes in front of the previous one, like deque.extendleft.
+        it = iter(iterable)
+        for data in it:
+            first = last = self._new_node(data)
+            break
+        else:
+            return None, None, 0
+        count = 1
+        if self.track_prev:
+            for count, data in enumerate(it, 2):
+                node = BackLinkedNode(data)
+                node.next = first
+                first.prev = node
+                first = node
+        else:
+            for count, data in enumerate(it, 2):
+                node = Node(data)
+                node.next = first
+                first = node
+        return first, last, count
+
+    def _chunk_chain(self, items):
+        first = last = None
+        for start in range(0, len(items), self.chunk_size):
+            chunk = UnrolledNode(prev=last)
+            chunk.items = items[start:start + self.chunk_size]
+            if last:
+                last.next = chunk
+            else:
+                first = chunk
+            last = chunk
+        return first, last
+
+    def _after_bulk_link(self, first, last, at_head=False):
+        if self.value_index:
+            # Nodes linked in at the head go in front of the nodes already
+            # indexed under the same value.
+            later = {}
+            current = first
+            while at_head:
+                if current.data in self._nodes_by_value:
+                    later[current.data] = self._nodes_by_value.pop(current.data)
+                if current is last:
+                    break
+                current = current.next
+            current = first
+            while current is not last:
+                self._remember(current)
+                current = current.next
+            self._remember(last)
+            for nodes in later.values():
+                for node in nodes if type(nodes) is list else (nodes,):
+                    self._remember(node)
+        if self.indexed:
+            self.build_index()
+
+    def extend(self, iterable):
+        if self.chunk_size:
+            items = list(iterable)
+            if not items:
+                return
+            start = 0
+            if self.tail:
+                # Top up the last chunk before starting new ones.
+                start = self.chunk_size - len(self.tail.items)
+                self.tail.items.extend(items[:start])
+            first, last = self._chunk_chain(items[start:])
+            if first:
+                if self.tail:
+                    self.tail.next = first
+                    first.prev = self.tail
+                else:
+                    self.head = first
+                self.tail = last
+            self.size += len(items)
+            return
+
+        first, last, count = self._link_chain(iterable)
+        if count == 0:
+            return
+        if self.tail:
+            self.tail.next = first
+            if self.track_prev:
+                first.prev = self.tail
+        else:
+            self.head = first
+        self.tail = last
+        self.size += count
+        self._after_bulk_link(first, last)
+
+    def extendleft(self, iterable):
+        if self.chunk_size:
+            items = list(iterable)
+            if not items:
+                return
+            items.reverse()
+            first, last = self._chunk_chain(items)
+        else:
+            first, last, count = self._link_chain_reversed(iterable)
+            if count == 0:
+                return
+        last.next = self.head
+        if self.head is None:
+            self.tail = last
+        elif self.chunk_size or self.track_prev:
+            self.head.prev = last
+        self.head = first
+        if self.chunk_size:
+            self.size += len(items)
+        else:
+            self.size += count
+            self._after_bulk_link(first, last, at_head=True)
+
+    def pop_many(self, k, last=True):
+        """Remove up to k items from the tail (or the head) in one pass.
+
+        Items are returned in the order they were removed; k <= 0 removes
+        nothing.
+        """
+        k = max(0, min(k, self.size))
+        if self.chunk_size or self.indexed:
+            remove = self.delete_last_node if last else self.delete_first_node
+            return [remove() for _ in range(k)]
+        items = []
+        if k == 0:
+            return items
+
+        if not last:
+            current = self.head
+            for _ in range(k):
+                items.append(current.data)
+                self._forget(current)
+                current = current.next
+            self.head = current
+            if current is None:
+                self.tail = None
+            elif self.track_prev:
+                current.prev = None
+        elif self.track_prev:
+            current = self.tail
+            for _ in range(k):
+                items.append(current.data)
+                self._forget(current)
+                current = current.prev
+            self.tail = current
+            if current is None:
+                self.head = None
+            else:
+                current.next = None
+        else:
+            # Walk once to the node that becomes the new tail.
+            keep = self.size - k
+            if keep == 0:
+                items = list(self.iter())
+                self.head = self.tail = None
+                self._nodes_by_value = {}
+            else:
+                new_tail = self.head
+                for _ in range(keep - 1):
+                    new_tail = new_tail.next
+                current = new_tail.next
+                while current:
+                    items.append(current.data)
+                    self._forget(current)
+                    current = current.next
+                new_tail.next = None
+                self.tail = new_tail
+            items.reverse()
+
+        self.size -= k
+        return items
+
+    # ---------------------------------------------------------------------
+    # Sorting, concatenation and splitting. These relink the existing nodes.
+
+    def sort(self, key=None, reverse=False):
+        """Stable in-place sort, O(n log n)."""
+        if self.chunk_size:
+            # Chunks are already arrays, so sort the items and refill them.
+            items = sorted(self.iter(), key=key, reverse=reverse)
+            self.head = self.tail = None
+            self.size = 0
+            self.extend(items)
+            return
+        if self.size < 2:
+            return
+        keys = None
+        if key is not None:
+            keys = {}
+            current = self.head
+            while current:
+                keys[current] = key(current.data)
+                current = current.next
+        self.head = merge_sort_chain(self.head, keys, reverse)
+        current = self.head
+        if self.track_prev:
+            self._relink_prev()
+        while current.next:
+            current = current.next
+        self.tail = current
+        if self.indexed:
+            self.build_index()
+
+    def _same_layout(self, other):
+        if bool(self.chunk_size) != bool(other.chunk_size) or \
+                self.track_prev != other.track_prev:
+            raise ValueError("both lists must use the same kind of node")
+
+    def concat(self, other):
+        """Move every node of `other` onto the end of this list.
+
+        The splice is O(1); `other` is left empty. With the value index or
+        the skip-list overlay switched on, those are updated afterwards.
+        """
+        self._same_layout(other)
+        if other.head is None:
+            return
+        first, last = other.head, other.tail
+        if self.tail:
+            self.tail.next = first
+            if self.track_prev or self.chunk_size:
+                first.prev = self.tail
+        else:
+            self.head = first
+        self.tail = last
+        self.size += other.size
+        other.head = other.tail = None
+        other.size = 0
+        other._nodes_by_value = {}
+        if other.indexed:
+            other.build_index()
+        if not self.chunk_size:
+            self._after_bulk_link(first, last)
+
+    def split_at(self, index):
+        """Cut the list before `index` and return the rest as a new list.
+
+        Finding the cut costs O(index) (O(log n) in indexed mode); the
+        nodes themselves are moved, not copied.
+        """
+        index = self._check_index(index, self.size + 1)
+        rest = SinglyLinkedList(chunk_size=self.chunk_size,
+                                track_prev=self.track_prev,
+                                value_index=self.value_index)
+        if index == self.size:
+            if self.indexed:
+                rest.build_index()
+            return rest
+
+        if self.chunk_size:
+            current, offset = self._chunk_at(index)
+            before = current.prev
+            if offset:
+                # The cut falls inside a chunk: split that chunk in two.
+                before, current = current, self._split_chunk(current, offset)
+        elif index == 0:
+            before, current = None, self.head
+        else:
+            if self.indexed:
+                before = self._index_node_at(index - 1)
+            else:
+                before = self.head
+                for _ in range(index - 1):
+                    before = before.next
+            current = before.next
+
+        rest.head, rest.tail = current, self.tail
+        rest.size = self.size - index
+        self.size = index
+        if before is None:
+            self.head = self.tail = None
+        else:
+            before.next = None
+            self.tail = before
+        if self.track_prev or self.chunk_size:
+            current.prev = None
+        if self.value_index:
+            # Forget from the tail end, where the moved nodes sit in their
+            # lists, then index them in order in the new list.
+            moved = rest.tail
+            while moved:
+                self._forget(moved)
+                moved = moved.prev
+            rest._after_bulk_link(rest.head, rest.tail)
+        if self.indexed:
+            self.build_index()
+            rest.build_index()
+        return rest
+
+    # ---------------------------------------------------------------------
+    # Positional access. Indexes are 0-based here, like a Python list.
+    # Without the index these walk from head; with it they cost O(log n).
+
+    def _check_index(self, index, upper):
+        if index < 0:
+            index += self.size
+        if not 0 <= index < upper:
+            raise IndexError("list index out of range")
+        return index
+
+    def __getitem__(self, index):
+        index = self._check_index(index, self.size)
+        if self.chunk_size:
+            current = self.head
+            while index >= len(current.items):
+                index -= len(current.items)
+                current = current.next
+            return current.items[index]
+        if index == self.size - 1:
+            return self.tail.data
+        if self.indexed:
+            return self._index_node_at(index).data
+        current = self.head
+        for _ in range(index):
+            current = current.next
+        return current.data
+
+    def insert(self, index, data):
+        index = self._check_index(index, self.size + 1)
+        if self.chunk_size:
+            self._chunk_insert(index, data)
+        elif self.indexed:
+            self._index_insert(index, self._new_node(data))
+        elif index == self.size:
+            self.append(data)
+        else:
+            self.append_at_a_location(data, index + 1)
+
+    def pop(self, index=-1):
+        index = self._check_index(index, self.size)
+        if self.chunk_size:
+            return self._chunk_remove(*self._chunk_at(index))
+        if self.indexed:
+            return self._index_delete(index).data
+        if index == 0:
+            return self.delete_first_node()
+        if index == self.size - 1 and self.track_prev:
+            return self.delete_last_node()
+        prev = self.head
+        for _ in range(index - 1):
+            prev = prev.next
+        node = prev.next
+        prev.next = node.next
+        if node is self.tail:
+            self.tail = prev
+        elif self.track_prev:
+            node.next.prev = prev
+        self._forget(node)
+        self.size -= 1
+        return node.data
+
+    # ---------------------------------------------------------------------
+    # Skip-list overlay (indexed mode)
+
+    def build_index(self):
+        """Switch on indexed mode and (re)build the overlay in O(n)."""
+        if self.chunk_size:
+            raise ValueError("indexed mode needs one node per item")
+        self.indexed = True
+        header = SkipTower(None, MAX_SKIP_LEVEL)
+        levels = 1
+        last = [header] * MAX_SKIP_LEVEL
+        last_position = [-1] * MAX_SKIP_LEVEL
+        position = 0
+        tail = None
+        current = self.head
+        while current:
+            height = random_tower_height()
+            if height:
+                tower = SkipTower(current, height)
+                for lvl in range(height):
+                    last[lvl].next[lvl] = tower
+                    last[lvl].width[lvl] = position - last_position[lvl]
+                    last[lvl] = tower
+                    last_position[lvl] = position
+                levels = max(levels, height)
+            tail = current
+            current = current.next
+            position += 1
+        # The last tower on each level spans to the end of the list.
+        for lvl in range(levels):
+            last[lvl].width[lvl] = position - last_position[lvl]
+        self._skip_head = header
+        self._skip_levels = levels
+        self.size = position
+        self.tail = tail
+
+    def _index_node_at(self, index):
+        tower = self._skip_head
+        position = -1
+        for lvl in range(self._skip_levels - 1, -1, -1):
+            while tower.next[lvl] and position + tower.width[lvl] <= index:
+                position += tower.width[lvl]
+                tower = tower.next[lvl]
+        return self._walk_from(tower, position, index)
+
+    def _walk_from(self, tower, position, index):
+        if index < 0:
+            return None
+        if tower.node is None:
+            current = self.head
+            position = 0
+        else:
+            current = tower.node
+        while position < index:
+            current = current.next
+            position += 1
+        return current
+
+    def _find_update(self, index):
+        # Last tower at or before `index` on every level, with its position.
+        update = [None] * self._skip_levels
+        update_position = [0] * self._skip_levels
+        tower = self._skip_head
+        position = -1
+        for lvl in range(self._skip_levels - 1, -1, -1):
+            while tower.next[lvl] and position + tower.width[lvl] <= index:
+                position += tower.width[lvl]
+                tower = tower.next[lvl]
+            update[lvl] = tower
+            update_position[lvl] = position
+        return update, update_position
+
+    def _index_insert(self, index, node):
+        update, update_position = self._find_update(index - 1)
+        prev = self._walk_from(update[0], update_position[0], index - 1)
+        if prev is None:
+            node.next = self.head
+            self.head = node
+        else:
+            node.next = prev.next
+            prev.next = node
+        if node.next is None:
+            self.tail = node
+        if self.track_prev:
+            node.prev = prev
+            if node.next:
+                node.next.prev = node
+        self._remember_inserted(node)
+
+        height = random_tower_height()
+        if height > self._skip_levels:
+            for lvl in range(self._skip_levels, height):
+                self._skip_head.next[lvl] = None
+                self._skip_head.width[lvl] = self.size + 1
+                update.append(self._skip_head)
+                update_position.append(-1)
+            self._skip_levels = height
+        tower = SkipTower(node, height) if height else None
+        for lvl in range(self._skip_levels):
+            before = update[lvl]
+            if lvl < height:
+                end = update_position[lvl] + before.width[lvl]
+                tower.next[lvl] = before.next[lvl]
+                tower.width[lvl] = end + 1 - index
+                before.next[lvl] = tower
+                before.width[lvl] = index - update_position[lvl]
+            else:
+                before.width[lvl] += 1
+        self.size += 1
+
+    def _index_delete(self, index):
+        update, update_position = self._find_update(index - 1)
+        prev = self._walk_from(update[0], update_position[0], index - 1)
+        node = self.head if prev is None else prev.next
+        if prev is None:
+            self.head = node.next
+        else:
+            prev.next = node.next
+        if node is self.tail:
+            self.tail = prev
+        elif self.track_prev:
+            node.next.prev = prev
+        self._forget(node)
+
+        for lvl in range(self._skip_levels):
+            before = update[lvl]
+            after = before.next[lvl]
+            if after is not None and after.node is node:
+                before.width[lvl] += after.width[lvl] - 1
+                before.next[lvl] = after.next[lvl]
+            else:
+                before.width[lvl] -= 1
+        while self._skip_levels > 1 and \
+                self._skip_head.next[self._skip_levels - 1] is None:
+            self._skip_levels -= 1
+        self.size -= 1
+        node.next = None
+        return node
+
+
+def benchmark_indexed(sizes=(10**4, 10**5, 10**6), ops=200):
+    """Random positional reads and insert/pop pairs, linear walk vs index."""
+    print(f"{'size':>10} {'mode':<8} {'getitem us/op':>14} {'insert+pop us/op':>17}")
+    for n in sizes:
+        positions = [randrange(n) for _ in range(ops)]
+        for indexed in (False, True):
+            words = SinglyLinkedList()
+            for i in range(n):
+                words.append(i)
+            if indexed:
+                words.build_index()
+
+            start = time.perf_counter()
+            for position in positions:
+                words[position]
+            read = (time.perf_counter() - start) / ops * 1e6
+
+            start = time.perf_counter()
+            for position in positions:
+                words.insert(position, -1)
+                words.pop(position)
+            write = (time.perf_counter() - start) / ops * 1e6
+
+            mode = 'indexed' if indexed else 'linear'
+            print(f"{n:>10,} {mode:<8} {read:>14.2f} {write:>17.2f}")
+
+
+def benchmark_drain(n=100_000):
+    """Drain n items from the back: O(n) walk per delete vs track_prev."""
+    print(f"{'method':<28} {'seconds':>9}")
+    for label, track_prev, batch in (
+            ('delete_last_node (walk)', False, None),
+            ('delete_last_node (prev)', True, None),
+            ('pop_many (walk)', False, 1000),
+            ('pop_many (prev)', True, 1000)):
+        words = SinglyLinkedList(track_prev=track_prev)
+        for i in range(n):
+            words.append(i)
+        start = time.perf_counter()
+        if batch:
+            while words.size:
+                words.pop_many(batch)
+        else:
+            while words.size:
+                words.delete_last_node()
+        print(f"{label:<28} {time.perf_counter() - start:>9.3f}")
+
+
+def benchmark_sort(n=10**6):
+    """In-place merge sort vs exporting to a Python list and rebuilding."""
+    values = [randrange(n) for _ in range(n)]
+    print(f"{'method':<28} {'seconds':>9}")
+
+    words = SinglyLinkedList.from_iterable(values)
+    start = time.perf_counter()
+    words = SinglyLinkedList.from_iterable(sorted(words.iter()))
+    print(f"{'export, sort, rebuild':<28} {time.perf_counter() - start:>9.3f}")
+
+    words = SinglyLinkedList.from_iterable(values)
+    start = time.perf_counter()
+    words.sort()
+    print(f"{'sort() relinking nodes':<28} {time.perf_counter() - start:>9.3f}")
+
+    start = time.perf_counter()
+    rest = words.split_at(n // 2)
+    words.concat(rest)
+    print(f"{'split_at(n/2) + concat':<28} {time.perf_counter() - start:>9.3f}")
+
+
+def benchmark_bulk_load(n=10**6):
+    """Load n items with repeated append() vs from_iterable()."""
+    values = range(n)
+    print(f"{'method':<26} {'seconds':>9}")
+    gc_was_enabled = gc.isenabled()
+    gc.disable()    # timed with the cyclic GC off, as timeit does
+    try:
+        start = time.perf_counter()
+        words = SinglyLinkedList()
+        for value in values:
+            words.append(value)
+        print(f"{'append() per item':<26} {time.perf_counter() - start:>9.3f}")
+
+        start = time.perf_counter()
+        words = SinglyLinkedList.from_iterable(values)
+        print(f"{'from_iterable()':<26} {time.perf_counter() - start:>9.3f}")
+
+        start = time.perf_counter()
+        words = SinglyLinkedList.from_iterable(values, chunk_size=64)
+        print(f"{'from_iterable(chunk=64)':<26} {time.perf_counter() - start:>9.3f}")
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+def benchmark_value_index(n=10**5, lookups=1000):
+    """Membership/delete-by-value cost and the memory the index adds."""
+    values = list(range(n))
+    targets = [randrange(n) for _ in range(lookups)]
+    print(f"{'mode':<12} {'bytes/elem':>11} {'search us/op':>13} {'delete us/op':>13}")
+    for value_index in (False, True):
+        tracemalloc.start()
+        words = SinglyLinkedList(value_index=value_index)
+        for value in values:
+            words.append(value)
+        used, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        start = time.perf_counter()
+        for target in targets:
+            target in words
+        search = (time.perf_counter() - start) / lookups * 1e6
+
+        start = time.perf_counter()
+        for target in targets:
+            words.delete_at_a_location(target)
+        delete = (time.perf_counter() - start) / lookups * 1e6
+
+        mode = 'value index' if value_index else 'scan'
+        print(f"{mode:<12} {used / n:>11.1f} {search:>13.2f} {delete:>13.2f}")
+
+
+def check_value_index(ops=5000, values=4, seed=0):
+    """Random edits with and without value_index must give the same list.
+
+    With only a few distinct values nearly every item is a duplicate, so
+    this checks that the index picks the same duplicate as a scan.
+    """
+    rng = Random(seed)
+    plain = SinglyLinkedList(track_prev=True)
+    indexed = SinglyLinkedList(value_index=True)
+    for _ in range(ops):
+        value = rng.randrange(values)
+        action = rng.randrange(6)
+        for words in (plain, indexed):
+            state = rng.getstate()
+            if action == 0:
+                words.append(value)
+            elif action == 1:
+                words.append_at_a_location(value, rng.randrange(1, words.size + 2))
+            elif action == 2:
+                words.extendleft([rng.randrange(values) for _ in range(3)])
+            elif action == 3:
+                words.delete_at_a_location(value)
+            elif action == 4:
+                words.append_with_same_data(value)
+            elif words.size:
+                words.pop(rng.randrange(words.size))
+            if words is plain:
+                rng.setstate(state)
+        assert list(plain.iter()) == list(indexed.iter()), (
+            list(plain.iter()), list(indexed.iter()))
+    print(f"{ops} edits, value index and scan agree")
+
+
+def check_unrolled(ops=5000, values=4, seed=0):
+    """Random edits on one Node per item and on chunks must agree.
+
+    With only a few distinct values nearly every item is a duplicate, so
+    this checks that both backends delete and insert at the same copy.
+    """
+    rng = Random(seed)
+    nodes = SinglyLinkedList()
+    chunks = SinglyLinkedList(chunk_size=4)
+    for _ in range(ops):
+        value = rng.randrange(values)
+        action = rng.randrange(6)
+        for words in (nodes, chunks):
+            state = rng.getstate()
+            if action == 0:
+                words.append(value)
+            elif action == 1:
+                words.append_at_a_location(value, rng.randrange(1, words.size + 2))
+            elif action == 2:
+                words.extendleft([rng.randrange(values) for _ in range(3)])
+            elif action == 3:
+                words.delete_at_a_location(value)
+            elif action == 4:
+                words.append_with_same_data(value)
+            elif words.size:
+                words.pop(rng.randrange(words.size))
+            if words is nodes:
+                rng.setstate(state)
+        assert list(nodes.iter()) == list(chunks.iter()), (
+            list(nodes.iter()), list(chunks.iter()))
+        assert nodes.size == chunks.size
+    print(f"{ops} edits, node and unrolled backends agree")
+
+
+def benchmark_unrolled(n=10**6, chunk_sizes=(None, 16, 64, 256)):
+    """Bytes per element, iter() and search() time for each backend."""
+    values = list(range(n))  # allocated up front so only nodes are measured
+    print(f"{'chunk':>6} {'bytes/elem':>11} {'iter ms':>9} {'search ms':>10}")
+    for chunk_size in chunk_sizes:
+        tracemalloc.start()
+        words = SinglyLinkedList(chunk_size=chunk_size)
+        for value in values:
+            words.append(value)
+        used, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        start = time.perf_counter()
+        for _ in words.iter():
+            pass
+        scan = (time.perf_counter() - start) * 1e3
+
+        start = time.perf_counter()
+        words.search(-1)
+        search = (time.perf_counter() - start) * 1e3
+
+        label = chunk_size or 'node'
+        print(f"{label:>6} {used / n:>11.1f} {scan:>9.1f} {search:>10.1f}")
+
 
 
 
@@ -238,13 +1380,112 @@ class SinglyLinkedList:
 
 # print("After:", list(words.iter()))
 # ---------------------------------------------------------------------------
-# Create a new linked list, append some elements and delete a specific node
-words = SinglyLinkedList()
-words.append('eggs')
-words.append('ham')
-words.append('spam')
-print("Before deletion:", list(words.iter()))
-words.delete_at_a_location('ham')
-print("After deletion:", list(words.iter()))
-words.clear()
-print("After clearing:", list(words.iter()))
+# Indexed mode: positional access through the skip-list overlay
+# words = SinglyLinkedList(indexed=True)
+# for word in ('eggs', 'ham', 'spam'):
+#     words.append(word)
+# words.insert(1, 'new')
+# print(words[1], words[-1], len(words))
+# # → new spam 4
+# print(words.pop(0), list(words.iter()))
+# # → eggs ['new', 'ham', 'spam']
+
+
+# ---------------------------------------------------------------------------
+# Compare the linear walk against the indexed mode
+# benchmark_indexed()
+
+
+# ---------------------------------------------------------------------------
+# Unrolled backend: same API, items stored 64 to a node
+# words = SinglyLinkedList(chunk_size=64)
+# for word in ('eggs', 'ham', 'spam'):
+#     words.append(word)
+# print(list(words.iter()), words.delete_last_node(), len(words))
+# # → ['eggs', 'ham', 'spam'] spam 2
+
+
+# ---------------------------------------------------------------------------
+# Memory per element and scan speed, one Node per item vs unrolled chunks
+# benchmark_unrolled()
+
+# Duplicates: both backends must edit the same copy
+# check_unrolled()
+
+
+# ---------------------------------------------------------------------------
+# track_prev keeps a back pointer per node so the tail is removed in O(1)
+# words = SinglyLinkedList(track_prev=True)
+# for i in range(6):
+#     words.append(i)
+# print(words.delete_last_node(), words.pop_many(2), words.pop_many(2, last=False))
+# # → 5 [4, 3] [0, 1]
+
+
+# ---------------------------------------------------------------------------
+# Drain 100k items from the back with and without back pointers
+# benchmark_drain()
+
+
+# ---------------------------------------------------------------------------
+# value_index=True answers search / delete_at_a_location from a dict
+# words = SinglyLinkedList(value_index=True)
+# for word in ('eggs', 'ham', 'spam'):
+#     words.append(word)
+# print('ham' in words, words.delete_at_a_location('ham').data, 'ham' in words)
+# # → True ham False
+
+
+# ---------------------------------------------------------------------------
+# Membership checks on a long list, with the memory the index costs
+# benchmark_value_index()
+
+
+# ---------------------------------------------------------------------------
+# Duplicates: the index must pick the same node as a scan from head
+# check_value_index()
+
+
+# ---------------------------------------------------------------------------
+# Bulk construction and extension
+# words = SinglyLinkedList.from_iterable(['ham', 'spam'])
+# words.extend(['bacon', 'sausage'])
+# words.extendleft(['eggs', 'toast'])
+# print(list(words.iter()), words.size)
+# # → ['toast', 'eggs', 'ham', 'spam', 'bacon', 'sausage'] 6
+
+
+# ---------------------------------------------------------------------------
+# Loading 1M items: append() per item vs from_iterable()
+# benchmark_bulk_load()
+
+
+# ---------------------------------------------------------------------------
+# Sort, split and concatenate by relinking nodes
+# words = SinglyLinkedList.from_iterable(['spam', 'eggs', 'ham', 'bacon'])
+# words.sort()
+# rest = words.split_at(2)
+# print(list(words.iter()), list(rest.iter()))
+# # → ['bacon', 'eggs'] ['ham', 'spam']
+# rest.concat(words)
+# print(list(rest.iter()), words.size)
+# # → ['ham', 'spam', 'bacon', 'eggs'] 0
+
+
+# ---------------------------------------------------------------------------
+# Sorting 1M nodes in place vs export-sort-rebuild
+# benchmark_sort()
+
+
+if __name__ == "__main__":
+    # ---------------------------------------------------------------------------
+    # Create a new linked list, append some elements and delete a specific node
+    words = SinglyLinkedList()
+    words.append('eggs')
+    words.append('ham')
+    words.append('spam')
+    print("Before deletion:", list(words.iter()))
+    words.delete_at_a_location('ham')
+    print("After deletion:", list(words.iter()))
+    words.clear()
+    print("After clearing:", list(words.iter()))
@@ -1,17 +1,329 @@
+import contextlib
+import gc
+import io
+import time
+import tracemalloc
+from itertools import islice
+from random import Random, randrange
+
+
 class Node:
+    __slots__ = ('data', 'next', 'prev')
     def __init__(self, data=None, next=None, prev=None):
         self.data = data
         self.next = next
         self.prev = prev
 
 
+# Node used by the unrolled backend: one node holds up to `chunk_size`
+# items in a plain list instead of one item per Node object.
+class UnrolledNode:
+    __slots__ = ('items', 'next', 'prev')
+    def __init__(self, next=None, prev=None):
+        self.items = []
+        self.next = next
+        self.prev = prev
+
+
+def merge_chains(a, b, keys=None, reverse=False):
+    """Merge two sorted chains of nodes by relinking them.
+
+    On ties the node from `a` comes first, which keeps the sort stable.
+    """
+    dummy = tail = Node()
+    while a and b:
+        if keys is None:
+            key_a, key_b = a.data, b.data
+        else:
+            key_a, key_b = keys[a], keys[b]
+        if (key_a < key_b) if reverse else (key_b < key_a):
+            tail.next = b
+            tail = b
+            b = b.next
+        else:
+            tail.next = a
+            tail = a
+            a = a.next
+    tail.next = a or b
+    return dummy.next
+
+
+def merge_sort_chain(head, keys=None, reverse=False):
+    """Bottom-up merge sort of a node chain; returns the new head.
+
+    bins[i] holds a sorted run of 2**i nodes (or None). Each node is merged
+    up through the bins like a carry in binary addition, so no node is
+    allocated and nothing is copied into a Python list.
+    """
+    bins = []
+    current = head
+    while current:
+        carry = current
+        current = current.next
+        carry.next = None
+        i = 0
+        while i < len(bins) and bins[i] is not None:
+            carry = merge_chains(bins[i], carry, keys, reverse)
+            bins[i] = None
+            i += 1
+        if i == len(bins):
+            bins.append(carry)
+        else:
+            bins[i] = carry
+    result = None
+    for run in bins:
+        if run is not None:
+            # Higher bins hold earlier nodes, so they go first on ties.
+            result = merge_chains(run, result, keys, reverse)
+    return result
+
+
 class DoublyLinkedList:
-    def __init__(self):
+    def __init__(self, chunk_size=None, value_index=False):
+        if value_index and chunk_size:
+            raise ValueError("value index needs one node per item")
         self.head = None
         self.tail = None
         self.count = 0
+        self.chunk_size = chunk_size
+        self.value_index = value_index
+        self._nodes_by_value = {}
+        # Bumped by every mutating method so live iterators can fail fast.
+        self._mod_count = 0
+
+    # Value index: data -> node, or data -> [nodes] once a value is
+    # duplicated. Each list is kept in list order, so search() returns the
+    # same node a scan from head would find.
+    def _remember(self, node):
+        # For a node that is the last of its value in the list.
+        if self.value_index:
+            nodes = self._nodes_by_value.get(node.data)
+            if nodes is None:
+                self._nodes_by_value[node.data] = node
+            elif type(nodes) is list:
+                nodes.append(node)
+            else:
+                self._nodes_by_value[node.data] = [nodes, node]
+
+    def _remember_inserted(self, node):
+        # For a node already linked in anywhere: walk out from it both ways
+        # until an equal node or an end of the list shows its place.
+        if not self.value_index:
+            return
+        data = node.data
+        nodes = self._nodes_by_value.get(data)
+        if nodes is None:
+            self._nodes_by_value[data] = node
+            return
+        if type(nodes) is not list:
+            nodes = self._nodes_by_value[data] = [nodes]
+        before, after = node.prev, node.next
+        while True:
+            if after is None:
+                nodes.append(node)
+                return
+            if before is None:
+                nodes.insert(0, node)
+                return
+            if after.data == data:
+                nodes.insert(nodes.index(after), node)
+                return
+            if before.data == data:
+                nodes.insert(nodes.index(before) + 1, node)
+                return
+            before, after = before.prev, after.next
+
+    def _forget(self, node):
+        if self.value_index:
+            nodes = self._nodes_by_value[node.data]
+            if nodes is node:
+                del self._nodes_by_value[node.data]
+                return
+            if nodes[-1] is node:
+                nodes.pop()
+            elif nodes[0] is node:
+                del nodes[0]
+            else:
+                nodes.remove(node)
+            if len(nodes) == 1:
+                self._nodes_by_value[node.data] = nodes[0]
+
+    # Unrolled backend: positions are 0-based, as in __getitem__.
+
+    def _chunk_at(self, index):
+        # The chunk holding position `index` and the offset inside it.
+        current = self.head
+        while index >= len(current.items):
+            index -= len(current.items)
+            current = current.next
+        return current, index
+
+    def _split_chunk(self, chunk, offset):
+        # Move chunk.items[offset:] into a new chunk right after it.
+        cut = UnrolledNode(next=chunk.next, prev=chunk)
+        cut.items = chunk.items[offset:]
+        del chunk.items[offset:]
+        if chunk.next:
+            chunk.next.prev = cut
+        else:
+            self.tail = cut
+        chunk.next = cut
+        return cut
+
+    def _chunk_insert(self, index, data):
+        if index == self.count:
+            self.append(data)
+            return
+        chunk, offset = self._chunk_at(index)
+        chunk.items.insert(offset, data)
+        self.count += 1
+        if len(chunk.items) > self.chunk_size:
+            self._split_chunk(chunk, len(chunk.items) // 2)
+
+    def _chunk_insert_before_match(self, data):
+        chunk = self.head
+        while chunk:
+            if data in chunk.items:
+                chunk.items.insert(chunk.items.index(data), data)
+                self.count += 1
+                if len(chunk.items) > self.chunk_size:
+                    self._split_chunk(chunk, len(chunk.items) // 2)
+                return
+            chunk = chunk.next
+
+    def __len__(self):
+        return self.count
+
+    @classmethod
+    def from_iterable(cls, iterable, **options):
+        words = cls(**options)
+        words.extend(iterable)
+        return words
+
+    # Bulk loading. The new nodes are linked in a tight loop and head, tail
+    # and count are fixed up once, after the loop.
+
+    def _link_chain(self, iterable):
+        dummy = last = Node()
+        count = 0
+        for count, data in enumerate(iterable, 1):
+            node = Node(data, None, last)
+            last.next = node
+            last = node
+        first = dummy.next
+        if first is not None:
+            first.prev = None
+        return first, last, count
+
+    def _link_chain_reversed(self, iterable):
+        # Each item goes in front of the previous one, like deque.extendleft.
+        it = iter(iterable)
+        for data in it:
+            first = last = Node(data)
+            break
+        else:
+            return None, None, 0
+        count = 1
+        for count, data in enumerate(it, 2):
+            node = Node(data, first)
+            first.prev = node
+            first = node
+        return first, last, count
+
+    def _chunk_chain(self, items):
+        first = last = None
+        for start in range(0, len(items), self.chunk_size):
+            chunk = UnrolledNode(prev=last)
+            chunk.items = items[start:start + self.chunk_size]
+            if last:
+                last.next = chunk
+            else:
+                first = chunk
+            last = chunk
+        return first, last
+
+    def _remember_chain(self, first, last, at_head=False):
+        if self.value_index:
+            # Nodes linked in at the head go in front of the nodes already
+            # indexed under the same value.
+            later = {}
+            current = first
+            while at_head:
+                if current.data in self._nodes_by_value:
+                    later[current.data] = self._nodes_by_value.pop(current.data)
+                if current is last:
+                    break
+                current = current.next
+            current = first
+            while current is not last:
+                self._remember(current)
+                current = current.next
+            self._remember(last)
+            for nodes in later.values():
+                for node in nodes if type(nodes) is list else (nodes,):
+                    self._remember(node)
+
+    def extend(self, iterable):
+        self._mod_count += 1
+        if self.chunk_size:
+            items = list(iterable)
+            start = 0
+            if self.tail:
+                # Top up the last chunk before starting new ones.
+                start = self.chunk_size - len(self.tail.items)
+                self.tail.items.extend(items[:start])
+            first, last = self._chunk_chain(items[start:])
+            count = len(items)
+        else:
+            first, last, count = self._link_chain(iterable)
+            if count:
+                self._remember_chain(first, last)
+        if first is None:
+            self.count += count
+            return
+        if self.tail:
+            self.tail.next = first
+            first.prev = self.tail
+        else:
+            self.head = first
+        self.tail = last
+        self.count += count
+
+    def extendleft(self, iterable):
+        self._mod_count += 1
+        if self.chunk_size:
+            items = list(iterable)
+            items.reverse()
+            first, last = self._chunk_chain(items)
+            count = len(items)
+        else:
+            first, last, count = self._link_chain_reversed(iterable)
+            if count:
+                self._remember_chain(first, last, at_head=True)
+        if first is None:
+            return
+        if self.head:
+            last.next = self.head
+            self.head.prev = last
+        else:
+            self.tail = last
+        self.head = first
+        self.count += count
 
     def append_at_start(self, data):
+        self._mod_count += 1
+        if self.chunk_size:
+            head = self.head
+            if head is None or len(head.items) >= self.chunk_size:
+                head = UnrolledNode(next=self.head)
+                if self.head:
+                    self.head.prev = head
+                else:
+                    self.tail = head
+                self.head = head
+            head.items.insert(0, data)
+            self.count += 1
+            return
         new_node = Node(data)
         if self.head is None:
             self.head = new_node
@@ -19,10 +331,26 @@ class DoublyLinkedList:
         else:
             new_node.next = self.head
             self.head.prev = new_node
+            self.head = new_node
+        self._remember_inserted(new_node)
         self.count += 1
 
     def append(self, data):
+        self._mod_count += 1
+        if self.chunk_size:
+            tail = self.tail
+            if tail is None or len(tail.items) >= self.chunk_size:
+                tail = UnrolledNode(prev=self.tail)
+                if self.tail:
+                    self.tail.next = tail
+                else:
+                    self.head = tail
+                self.tail = tail
+            tail.items.append(data)
+            self.count += 1
+            return
         new_node = Node(data, None, None)
+        self._remember(new_node)
         if self.head is None:
             self.head = new_node
             self.tail = new_node
@@ -33,23 +361,40 @@ class DoublyLinkedList:
         self.count += 1
 
     def append_at_a_location(self, data):
-        current = self.head
-        prev = self.head
-        new_node = Node(data, None, None)
-        while current:
-            if current.data == data:
-                new_node.prev = prev
-                new_node.next = current
-                prev.next = new_node
-                current.prev = new_node
-                self.count += 1
-            prev = current
-            current = current.next
+        """Insert data once, in front of the first item equal to it."""
+        self._mod_count += 1
+        if self.chunk_size:
+            self._chunk_insert_before_match(data)
+            return
+        # With the value index search() is an O(1) dict lookup, otherwise a
+        # scan from head; either way it finds the first match in list order.
+        current = self.search(data)
+        if current is None:
+            return
+        new_node = Node(data, current, current.prev)
+        if current.prev:
+            current.prev.next = new_node
+        else:
+            self.head = new_node
+        current.prev = new_node
+        self._remember_inserted(new_node)
+        self.count += 1
+
     def append_at_index(self, index, data):
+        self._mod_count += 1
         # 1. Bounds check
         if index < 1:
             print("❌ Index should be 1 or greater.")
             return
+        if self.chunk_size:
+            # Same positions as the node version below.
+            if index == 1:
+                self.append_at_start(data)
+            elif index == self.count:
+                self.append(data)
+            else:
+                self._chunk_insert(index, data)
+            return
 
         new_node = Node(data, None, None)
 
@@ -84,32 +429,311 @@ class DoublyLinkedList:
             new_node.next = current
             current.prev = new_node
 
+        self._remember_inserted(new_node)
         self.count += 1
 
     def iter(self):
         current = self.head
+        if self.chunk_size:
+            while current:
+                yield from current.items
+                current = current.next
+            return
         while current:
             val = current.data
             current = current.next 
             yield val
     
+    # Sorting, concatenation and splitting. These relink the existing nodes.
+
+    def sort(self, key=None, reverse=False):
+        """Stable in-place sort, O(n log n)."""
+        self._mod_count += 1
+        if self.chunk_size:
+            # Chunks are already arrays, so sort the items and refill them.
+            items = sorted(self.iter(), key=key, reverse=reverse)
+            self.head = self.tail = None
+            self.count = 0
+            self.extend(items)
+            return
+        if self.count < 2:
+            return
+        keys = None
+        if key is not None:
+            keys = {}
+            current = self.head
+            while current:
+                keys[current] = key(current.data)
+                current = current.next
+        self.head = merge_sort_chain(self.head, keys, reverse)
+        # The merge only maintains `next`; restore `prev` and find the tail.
+        prev = None
+        current = self.head
+        while current:
+            current.prev = prev
+            prev = current
+            current = current.next
+        self.tail = prev
+
+    def concat(self, other):
+        """Move every node of `other` onto the end of this list in O(1).
+
+        `other` is left empty. With the value index switched on, the moved
+        nodes are re-registered here, which is O(len(other)).
+        """
+        if bool(self.chunk_size) != bool(other.chunk_size):
+            raise ValueError("both lists must use the same kind of node")
+        self._mod_count += 1
+        other._mod_count += 1
+        if other.head is None:
+            return
+        first, last = other.head, other.tail
+        if self.tail:
+            self.tail.next = first
+            first.prev = self.tail
+        else:
+            self.head = first
+        self.tail = last
+        self.count += other.count
+        other.head = other.tail = None
+        other.count = 0
+        other._nodes_by_value = {}
+        if not self.chunk_size:
+            self._remember_chain(first, last)
+
+    def split_at(self, index):
+        """Cut the list before `index` and return the rest as a new list.
+
+        The cut is found from the nearer end, O(min(index, n - index)); the
+        nodes themselves are moved, not copied.
+        """
+        if index < 0:
+            index += self.count
+        if not 0 <= index <= self.count:
+            raise IndexError("list index out of range")
+        self._mod_count += 1
+        rest = DoublyLinkedList(chunk_size=self.chunk_size,
+                                value_index=self.value_index)
+        if index == self.count:
+            return rest
+
+        if self.chunk_size:
+            current, offset = self._chunk_at(index)
+            if offset:
+                # The cut falls inside a chunk: split that chunk in two.
+                current = self._split_chunk(current, offset)
+        else:
+            current = self._node_at(index)
+
+        before = current.prev
+        rest.head, rest.tail = current, self.tail
+        rest.count = self.count - index
+        self.count = index
+        current.prev = None
+        if before is None:
+            self.head = self.tail = None
+        else:
+            before.next = None
+            self.tail = before
+        if self.value_index:
+            # Forget from the tail end, where the moved nodes sit in their
+            # lists, then index them in order in the new list.
+            moved = rest.tail
+            while moved:
+                self._forget(moved)
+                moved = moved.prev
+            rest._remember_chain(rest.head, rest.tail)
+        return rest
+
+    # Lazy traversal. These generators walk the nodes in place and raise
+    # RuntimeError if the list is changed while they are running.
+
+    def _check_unchanged(self, expected):
+        if self._mod_count != expected:
+            raise RuntimeError("DoublyLinkedList changed during iteration")
+
+    def __iter__(self):
+        if self.chunk_size:
+            expected = self._mod_count
+            current = self.head
+            while current:
+                for data in current.items:
+                    yield data
+                    self._check_unchanged(expected)
+                current = current.next
+            return
+        yield from self.iter_from(self.head)
+
+    def __reversed__(self):
+        if self.chunk_size:
+            expected = self._mod_count
+            current = self.tail
+            while current:
+                for data in reversed(current.items):
+                    yield data
+                    self._check_unchanged(expected)
+                current = current.prev
+            return
+        yield from self.iter_from(self.tail, reverse=True)
+
+    def iter_from(self, node, reverse=False):
+        """Yield data starting at `node`, towards the tail or the head."""
+        if self.chunk_size:
+            raise TypeError("iter_from() needs an item node; the unrolled "
+                            "backend has none, iterate or slice the list")
+        expected = self._mod_count
+        current = node
+        if reverse:
+            while current:
+                yield current.data
+                self._check_unchanged(expected)
+                current = current.prev
+        else:
+            while current:
+                yield current.data
+                self._check_unchanged(expected)
+                current = current.next
+
+    def _node_at(self, index):
+        # Walk in from whichever end is closer.
+        if index <= self.count // 2:
+            current = self.head
+            for _ in range(index):
+                current = current.next
+        else:
+            current = self.tail
+            for _ in range(self.count - 1 - index):
+                current = current.prev
+        return current
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return DoublyLinkedListView(self, index)
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("list index out of range")
+        if self.chunk_size:
+            return next(islice(self, index, None))
+        return self._node_at(index).data
+
     def contains(self, data):
+        if self.value_index:
+            if data in self._nodes_by_value:
+                print(f"Data item is present in the list. i.e {data}")
+            else:
+                print(f"Data item is not present in the list. i.e {data}")
+            return
         for node_data in self.iter():
             if data == node_data:
                 print(f"Data item is present in the list. i.e {data}")
                 return
         print(f"Data item is not present in the list. i.e {data}")
     
+    def __contains__(self, data):
+        return self.search(data) is not None
+
+    def search(self, data):
+        if self.value_index:
+            nodes = self._nodes_by_value.get(data)
+            if type(nodes) is list:
+                return nodes[0]
+            return nodes
+        current = self.head
+        if self.chunk_size:
+            # Returns the chunk node that holds the item.
+            while current:
+                if data in current.items:
+                    return current
+                current = current.next
+            return None
+        while current:
+            if current.data == data:
+                return current
+            current = current.next
+        return None
+
+    def _unlink(self, node):
+        self._forget(node)
+        if node.prev:
+            node.prev.next = node.next
+        else:
+            self.head = node.next
+        if node.next:
+            node.next.prev = node.prev
+        else:
+            self.tail = node.prev
+        node.next = node.prev = None
+
+    def delete_first_node(self):
+        self._mod_count += 1
+        if self.head is None:
+            print("List is empty. Nothing to delete.")
+            return
+        head = self.head
+        if self.chunk_size:
+            deleted_data = head.items.pop(0)
+            if not head.items:
+                self._unlink(head)
+        else:
+            deleted_data = head.data
+            self._unlink(head)
+        self.count -= 1
+        return deleted_data
+
+    def delete_last_node(self):
+        self._mod_count += 1
+        if self.tail is None:
+            print("List is empty. Nothing to delete.")
+            return
+        tail = self.tail
+        if self.chunk_size:
+            deleted_data = tail.items.pop()
+            if not tail.items:
+                self._unlink(tail)
+        else:
+            deleted_data = tail.data
+            self._unlink(tail)
+        self.count -= 1
+        return deleted_data
+
     def delete(self, data):
+        self._mod_count += 1
         current = self.head
         node_deleted = False
         if current is None:
             print("List is empty. Nothing to delete.")
             return
+        elif self.chunk_size:
+            # Same item as the scan below: head, then tail, then the first
+            # match in list order.
+            if current.items[0] == data:
+                chunk, offset = current, 0
+            elif self.tail.items[-1] == data:
+                chunk, offset = self.tail, len(self.tail.items) - 1
+            else:
+                chunk = self.search(data)
+                offset = chunk.items.index(data) if chunk else None
+            if chunk:
+                del chunk.items[offset]
+                if not chunk.items:
+                    self._unlink(chunk)
+                node_deleted = True
+        elif self.value_index:
+            # Same node as the scan below: head, then tail, then the first
+            # match in list order.
+            if current.data == data:
+                node = current
+            elif self.tail.data == data:
+                node = self.tail
+            else:
+                node = self.search(data)
+            if node:
+                self._unlink(node)
+                node_deleted = True
         elif current.data == data:
-            self.head.prev = None
+            self._unlink(current)
             node_deleted = True
-            self.head = current.next
         elif self.tail.data == data:
             self.tail = self.tail.prev
             self.tail.next = None
@@ -127,6 +751,296 @@ class DoublyLinkedList:
             print(f"Node with data {data} deleted successfully.")
             self.count -= 1
 
+
+def benchmark_sort(n=10**6):
+    """In-place merge sort vs exporting to a Python list and rebuilding."""
+    values = [randrange(n) for _ in range(n)]
+    print(f"{'method':<28} {'seconds':>9}")
+
+    words = DoublyLinkedList.from_iterable(values)
+    start = time.perf_counter()
+    words = DoublyLinkedList.from_iterable(sorted(words))
+    print(f"{'export, sort, rebuild':<28} {time.perf_counter() - start:>9.3f}")
+
+    words = DoublyLinkedList.from_iterable(values)
+    start = time.perf_counter()
+    words.sort()
+    print(f"{'sort() relinking nodes':<28} {time.perf_counter() - start:>9.3f}")
+
+    start = time.perf_counter()
+    rest = words.split_at(n // 2)
+    words.concat(rest)
+    print(f"{'split_at(n/2) + concat':<28} {time.perf_counter() - start:>9.3f}")
+
+
+def benchmark_bulk_load(n=10**6):
+    """Load n items with repeated append() vs from_iterable()."""
+    values = range(n)
+    print(f"{'method':<26} {'seconds':>9}")
+    gc_was_enabled = gc.isenabled()
+    gc.disable()    # timed with the cyclic GC off, as timeit does
+    try:
+        start = time.perf_counter()
+        words = DoublyLinkedList()
+        for value in values:
+            words.append(value)
+        print(f"{'append() per item':<26} {time.perf_counter() - start:>9.3f}")
+
+        start = time.perf_counter()
+        words = DoublyLinkedList.from_iterable(values)
+        print(f"{'from_iterable()':<26} {time.perf_counter() - start:>9.3f}")
+
+        start = time.perf_counter()
+        words = DoublyLinkedList.from_iterable(values, chunk_size=64)
+        print(f"{'from_iterable(chunk=64)':<26} {time.perf_counter() - start:>9.3f}")
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+class DoublyLinkedListView:
+    """A lazy words[start:stop:step] window over a DoublyLinkedList.
+
+    Nothing is copied: the slice is resolved against the list's current
+    length whenever the view is iterated, and iteration walks the nodes
+    in place (failing fast if the list changes underneath it).
+    """
+
+    def __init__(self, source, window):
+        self.source = source
+        self.window = window
+
+    def _range(self):
+        return range(*self.window.indices(self.source.count))
+
+    def __len__(self):
+        return len(self._range())
+
+    def __iter__(self):
+        positions = self._range()
+        if not positions:
+            return iter(())
+        step = positions.step
+        source = self.source
+        if source.chunk_size:
+            if step > 0:
+                return islice(source, positions.start, positions.stop, step)
+            last = source.count - 1
+            return islice(reversed(source), last - positions.start,
+                          last - positions.stop, -step)
+        first = source._node_at(positions.start)
+        walk = source.iter_from(first, reverse=step < 0)
+        return islice(walk, 0, (len(positions) - 1) * abs(step) + 1, abs(step))
+
+    def __reversed__(self):
+        return iter(DoublyLinkedListView(self.source, self._reversed_window()))
+
+    def _reversed_window(self):
+        positions = self._range()[::-1]
+        if not positions:
+            return slice(0, 0)
+        stop = positions.stop if positions.stop >= 0 else None
+        return slice(positions.start, stop, positions.step)
+
+    def __repr__(self):
+        return f"DoublyLinkedListView({list(self)!r})"
+
+
+def benchmark_value_index(n=10**5, lookups=1000):
+    """Membership/value-anchored insert cost and the memory the index adds."""
+    values = list(range(n))
+    targets = [randrange(n) for _ in range(lookups)]
+    print(f"{'mode':<12} {'bytes/elem':>11} {'search us/op':>13} {'insert us/op':>13}")
+    for value_index in (False, True):
+        tracemalloc.start()
+        words = DoublyLinkedList(value_index=value_index)
+        for value in values:
+            words.append(value)
+        used, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        start = time.perf_counter()
+        for target in targets:
+            target in words
+        search = (time.perf_counter() - start) / lookups * 1e6
+
+        start = time.perf_counter()
+        for target in targets:
+            words.append_at_a_location(target)
+        insert = (time.perf_counter() - start) / lookups * 1e6
+
+        mode = 'value index' if value_index else 'scan'
+        print(f"{mode:<12} {used / n:>11.1f} {search:>13.2f} {insert:>13.2f}")
+
+
+def check_value_index(ops=5000, values=4, seed=0):
+    """Random edits with and without value_index must give the same list.
+
+    With only a few distinct values nearly every item is a duplicate, so
+    this checks that the index picks the same duplicate as a scan.
+    """
+    rng = Random(seed)
+    plain = DoublyLinkedList()
+    indexed = DoublyLinkedList(value_index=True)
+    for _ in range(ops):
+        value = rng.randrange(values)
+        action = rng.randrange(6)
+        for words in (plain, indexed):
+            state = rng.getstate()
+            if action == 0:
+                words.append(value)
+            elif action == 1:
+                words.append_at_start(value)
+            elif action == 4:
+                words.append_at_a_location(value)
+            elif action == 2:
+                words.extendleft([rng.randrange(values) for _ in range(3)])
+            elif action == 3 and words.count:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    words.delete(value)
+            elif words.count > 1:
+                words.append_at_index(rng.randrange(1, words.count), value)
+            if words is plain:
+                rng.setstate(state)
+        assert list(plain) == list(indexed), (list(plain), list(indexed))
+    print(f"{ops} edits, value index and scan agree")
+
+
+def check_unrolled(ops=5000, values=4, seed=0):
+    """Random edits on one Node per item and on chunks must agree.
+
+    With only a few distinct values nearly every item is a duplicate, so
+    this checks that both backends delete and insert at the same copy.
+    """
+    words = DoublyLinkedList(chunk_size=4)
+    words.extend([1, 2, 'a', 2, 'a'])
+    with contextlib.redirect_stdout(io.StringIO()):
+        words.delete('a')
+    assert list(words) == [1, 2, 'a', 2], list(words)
+
+    rng = Random(seed)
+    nodes = DoublyLinkedList()
+    chunks = DoublyLinkedList(chunk_size=4)
+    for _ in range(ops):
+        value = rng.randrange(values)
+        action = rng.randrange(6)
+        for words in (nodes, chunks):
+            state = rng.getstate()
+            if action == 0:
+                words.append(value)
+            elif action == 1:
+                words.append_at_start(value)
+            elif action == 2:
+                words.extendleft([rng.randrange(values) for _ in range(3)])
+            elif action == 3 and words.count:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    words.delete(value)
+            elif action == 4:
+                words.append_at_a_location(value)
+            elif words.count > 1:
+                words.append_at_index(rng.randrange(1, words.count), value)
+            if words is nodes:
+                rng.setstate(state)
+        assert list(nodes) == list(chunks), (list(nodes), list(chunks))
+        assert len(nodes) == len(chunks)
+    print(f"{ops} edits, node and unrolled backends agree")
+
+
+def benchmark_unrolled(n=10**6, chunk_sizes=(None, 16, 64, 256)):
+    """Bytes per element, iter() and search() time for each backend."""
+    values = list(range(n))  # allocated up front so only nodes are measured
+    print(f"{'chunk':>6} {'bytes/elem':>11} {'iter ms':>9} {'search ms':>10}")
+    for chunk_size in chunk_sizes:
+        tracemalloc.start()
+        words = DoublyLinkedList(chunk_size=chunk_size)
+        for value in values:
+            words.append(value)
+        used, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        start = time.perf_counter()
+        for _ in words.iter():
+            pass
+        scan = (time.perf_counter() - start) * 1e3
+
+        start = time.perf_counter()
+        words.search(-1)
+        search = (time.perf_counter() - start) * 1e3
+
+        label = chunk_size or 'node'
+        print(f"{label:>6} {used / n:>11.1f} {scan:>9.1f} {search:>10.1f}")
+
+
+# Unrolled backend: same API, items stored 64 to a node
+# words = DoublyLinkedList(chunk_size=64)
+# words.append('egg')
+# words.append('ham')
+# words.append_at_start('spam')
+# print(list(words.iter()), words.delete_last_node(), len(words))
+# # → ['spam', 'egg', 'ham'] ham 2
+
+
+# Memory per element and scan speed, one Node per item vs unrolled chunks
+# benchmark_unrolled()
+
+# Duplicates: both backends must edit the same copy
+# check_unrolled()
+
+
+# value_index=True answers search / contains / delete from a dict
+# words = DoublyLinkedList(value_index=True)
+# words.append('egg')
+# words.append('ham')
+# words.append_at_a_location('ham')
+# print('ham' in words, list(words.iter()))
+# # → True ['egg', 'ham', 'ham']
+
+
+# Membership checks on a long list, with the memory the index costs
+# benchmark_value_index()
+
+
+# Duplicates: the index must pick the same node as a scan from head
+# check_value_index()
+
+
+# Bulk construction and extension
+# words = DoublyLinkedList.from_iterable(['ham', 'spam'])
+# words.extend(['bacon'])
+# words.extendleft(['egg', 'toast'])
+# print(list(words.iter()), words.count)
+# # → ['toast', 'egg', 'ham', 'spam', 'bacon'] 5
+
+
+# Loading 1M items: append() per item vs from_iterable()
+# benchmark_bulk_load()
+
+
+# Lazy traversal and windowed views, no copies of the list
+# words = DoublyLinkedList.from_iterable(['egg', 'ham', 'spam', 'bacon'])
+# print(list(reversed(words)), list(words[1:3]), list(words[::-2]))
+# # → ['bacon', 'spam', 'ham', 'egg'] ['ham', 'spam'] ['bacon', 'ham']
+# for word in words.iter_from(words.tail.prev, reverse=True):
+#     print(word)
+# for word in words:
+#     words.append('sausage')  # RuntimeError: changed during iteration
+
+
+# Sort, split and concatenate by relinking nodes
+# words = DoublyLinkedList.from_iterable(['spam', 'egg', 'ham', 'bacon'])
+# words.sort(reverse=True)
+# rest = words.split_at(2)
+# print(list(words), list(rest))
+# # → ['spam', 'ham'] ['egg', 'bacon']
+# words.concat(rest)
+# print(list(reversed(words)), rest.count)
+# # → ['bacon', 'egg', 'ham', 'spam'] 0
+
+
+# Sorting 1M nodes in place vs export-sort-rebuild
+# benchmark_sort()
+
+
 # words = DouplyLinkedList()
 # Insert a at start
 # words.append_at_start('book')
@@ -167,25 +1081,25 @@ class DoublyLinkedList:
 # words.contains("ham2")
 
 
+if __name__ == "__main__":
+    #   Deleting Element
+    words = DoublyLinkedList()
+    words.append('egg')   # List: egg
+    words.append('ham')   # List: egg <-> ham
+    words.append('spam')  # List: egg <-> ham <-> spam
 
-#   Deleting Element
-words = DoublyLinkedList()
-words.append('egg')   # List: egg
-words.append('ham')   # List: egg <-> ham
-words.append('spam')  # List: egg <-> ham <-> spam
-
-# before deletion
-current = words.head
-print("Doubly linked list before deletion:")
-while current:
- print(current.data)
- current = current.next
+    # before deletion
+    current = words.head
+    print("Doubly linked list before deletion:")
+    while current:
+     print(current.data)
+     current = current.next
 
-words.delete('ham')
+    words.delete('ham')
 
-# after deletion
-current = words.head
-print("Doubly linked list after deletion:")
-while current:
- print(current.data)
- current = current.next
\ No newline at end of file
+    # after deletion
+    current = words.head
+    print("Doubly linked list after deletion:")
+    while current:
+     print(current.data)
+     current = current.next
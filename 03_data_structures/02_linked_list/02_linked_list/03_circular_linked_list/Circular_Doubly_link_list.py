@@ -1,4 +1,10 @@
+import gc
+import time
+from collections import deque
+
+
 class Node:
+    __slots__ = ('data', 'next', 'prev')
     def __init__(self, data=None, next=None, prev=None):
         self.data = data
         self.next = next
@@ -11,6 +17,69 @@ class CircularDoublyLinkedList:
         self.tail = None
         self.count = 0
 
+    @classmethod
+    def from_iterable(cls, iterable):
+        words = cls()
+        words.extend(iterable)
+        return words
+
+    # Bulk loading. The new nodes are linked in a tight loop and head, tail,
+    # count and the head <-> tail links are fixed up once, after the loop.
+
+    def _link_chain(self, iterable):
+        dummy = last = Node()
+        count = 0
+        for count, data in enumerate(iterable, 1):
+            node = Node(data, None, last)
+            last.next = node
+            last = node
+        return dummy.next, last, count
+
+    def _link_chain_reversed(self, iterable):
+        # Each item goes in front of the previous one, like deque.extendleft.
+        it = iter(iterable)
+        for data in it:
+            first = last = Node(data)
+            break
+        else:
+            return None, None, 0
+        count = 1
+        for count, data in enumerate(it, 2):
+            node = Node(data, first)
+            first.prev = node
+            first = node
+        return first, last, count
+
+    def _close_ring(self):
+        self.tail.next = self.head
+        self.head.prev = self.tail
+
+    def extend(self, iterable):
+        first, last, count = self._link_chain(iterable)
+        if count == 0:
+            return
+        if self.tail:
+            self.tail.next = first
+            first.prev = self.tail
+        else:
+            self.head = first
+        self.tail = last
+        self._close_ring()
+        self.count += count
+
+    def extendleft(self, iterable):
+        first, last, count = self._link_chain_reversed(iterable)
+        if count == 0:
+            return
+        if self.head:
+            last.next = self.head
+            self.head.prev = last
+        else:
+            self.tail = last
+        self.head = first
+        self._close_ring()
+        self.count += count
+
     def append_at_start(self, data):
         new_node = Node(data)
         if self.head is None:
@@ -126,3 +195,188 @@ class CircularDoublyLinkedList:
 
         self.count -= 1
         print(f"Node with data {data} deleted successfully.")
+
+    def insert_before(self, node, data):
+        """Link a new node in front of `node` in O(1) and return it."""
+        new_node = Node(data, node, node.prev)
+        node.prev.next = new_node
+        node.prev = new_node
+        if node is self.head:
+            self.tail = new_node
+        self.count += 1
+        return new_node
+
+    def remove_node(self, node):
+        """Unlink a node we already hold a reference to, in O(1)."""
+        if self.count == 1:
+            self.head = self.tail = None
+        else:
+            node.prev.next = node.next
+            node.next.prev = node.prev
+            if node is self.head:
+                self.head = node.next
+            if node is self.tail:
+                self.tail = node.prev
+        node.next = node.prev = None
+        self.count -= 1
+        return node.data
+
+    def rotate(self, k=1):
+        """Rotate k steps to the right, like collections.deque.rotate.
+
+        Only head and tail move; the ring is walked the shorter way round,
+        so the cost is O(min(k, n - k)) and rotate(1) / rotate(-1) are O(1).
+        """
+        if self.count < 2:
+            return
+        k %= self.count
+        if k == 0:
+            return
+        head = self.head
+        if k <= self.count // 2:
+            for _ in range(k):
+                head = head.prev
+        else:
+            for _ in range(self.count - k):
+                head = head.next
+        self.head = head
+        self.tail = head.prev
+
+
+class RoundRobinScheduler:
+    """Hands out workers in turn from a CircularDoublyLinkedList.
+
+    The cursor is a node of the ring, so advance() and remove_current()
+    never rescan it. A worker with weight w keeps the turn for w calls to
+    advance() before the cursor moves on.
+    """
+
+    def __init__(self):
+        self.ring = CircularDoublyLinkedList()
+        self.cursor = None
+        self.weights = {}
+        self.credit = 0
+
+    def __len__(self):
+        return self.ring.count
+
+    def add(self, worker, weight=1):
+        # New workers join just behind the cursor, i.e. last in the round.
+        if weight < 1:
+            raise ValueError("weight must be at least 1")
+        if self.cursor is None:
+            self.ring.append(worker)
+            node = self.cursor = self.ring.tail
+            self.credit = weight
+        else:
+            node = self.ring.insert_before(self.cursor, worker)
+        self.weights[node] = weight
+        return node
+
+    def current(self):
+        if self.cursor is None:
+            return None
+        return self.cursor.data
+
+    def advance(self):
+        if self.cursor is None:
+            return None
+        self.credit -= 1
+        if self.credit <= 0:
+            self.cursor = self.cursor.next
+            self.credit = self.weights[self.cursor]
+        return self.cursor.data
+
+    def remove_current(self):
+        if self.cursor is None:
+            return None
+        node = self.cursor
+        following = node.next
+        del self.weights[node]
+        worker = self.ring.remove_node(node)
+        if self.ring.count:
+            self.cursor = following
+            self.credit = self.weights[following]
+        else:
+            self.cursor = None
+            self.credit = 0
+        return worker
+
+
+def benchmark_round_robin(workers=10_000, turns=10**6):
+    """advance() / remove_current() against collections.deque.rotate."""
+    print(f"{'structure':<24} {'advance ns/op':>14} {'remove ns/op':>13}")
+
+    scheduler = RoundRobinScheduler()
+    for worker in range(workers):
+        scheduler.add(worker)
+    start = time.perf_counter_ns()
+    for _ in range(turns):
+        scheduler.advance()
+    advance = (time.perf_counter_ns() - start) / turns
+    start = time.perf_counter_ns()
+    for _ in range(workers // 2):
+        scheduler.advance()
+        scheduler.remove_current()
+    remove = (time.perf_counter_ns() - start) / (workers // 2)
+    print(f"{'RoundRobinScheduler':<24} {advance:>14.0f} {remove:>13.0f}")
+
+    ring = deque(range(workers))
+    start = time.perf_counter_ns()
+    for _ in range(turns):
+        ring.rotate(-1)
+        ring[0]
+    advance = (time.perf_counter_ns() - start) / turns
+    start = time.perf_counter_ns()
+    for _ in range(workers // 2):
+        ring.rotate(-1)
+        ring.popleft()
+    remove = (time.perf_counter_ns() - start) / (workers // 2)
+    print(f"{'deque.rotate':<24} {advance:>14.0f} {remove:>13.0f}")
+
+
+def benchmark_bulk_load(n=10**6):
+    """Load n items with repeated append() vs from_iterable()."""
+    values = range(n)
+    print(f"{'method':<20} {'seconds':>9}")
+    gc_was_enabled = gc.isenabled()
+    gc.disable()    # timed with the cyclic GC off, as timeit does
+    try:
+        start = time.perf_counter()
+        words = CircularDoublyLinkedList()
+        for value in values:
+            words.append(value)
+        print(f"{'append() per item':<20} {time.perf_counter() - start:>9.3f}")
+
+        start = time.perf_counter()
+        words = CircularDoublyLinkedList.from_iterable(values)
+        print(f"{'from_iterable()':<20} {time.perf_counter() - start:>9.3f}")
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+# Bulk construction and extension
+# words = CircularDoublyLinkedList.from_iterable(['ham', 'spam'])
+# words.extendleft(['egg'])
+# print(list(words.iter()), words.tail.next.data, words.head.prev.data)
+# # → ['egg', 'ham', 'spam'] egg spam
+
+
+# Loading 1M items: append() per item vs from_iterable()
+# benchmark_bulk_load()
+
+
+# Round-robin dispatch: 'fast' gets two turns for every one of the others
+# scheduler = RoundRobinScheduler()
+# scheduler.add('fast', weight=2)
+# scheduler.add('slow')
+# scheduler.add('flaky')
+# print([scheduler.advance() for _ in range(5)])
+# # → ['fast', 'slow', 'flaky', 'fast', 'fast']
+# print(scheduler.remove_current(), scheduler.current())
+# # → fast slow
+
+
+# Scheduler turns against collections.deque.rotate
+# benchmark_round_robin()
@@ -1,4 +1,9 @@
+import gc
+import time
+
+
 class Node:
+    __slots__ = ('data', 'next')
     def __init__(self, data=None):
         self.data = data
         self.next = None
@@ -10,6 +15,63 @@ class CircularLinkedList:
         self.tail = None
         self.size = 0
 
+    @classmethod
+    def from_iterable(cls, iterable):
+        words = cls()
+        words.extend(iterable)
+        return words
+
+    # Bulk loading. The new nodes are linked in a tight loop and head, tail,
+    # size and the tail -> head link are fixed up once, after the loop.
+
+    def _link_chain(self, iterable):
+        dummy = last = Node()
+        count = 0
+        for count, data in enumerate(iterable, 1):
+            node = Node(data)
+            last.next = node
+            last = node
+        return dummy.next, last, count
+
+    def _link_chain_reversed(self, iterable):
+        # Each item goes in front of the previous one, like deque.extendleft.
+        it = iter(iterable)
+        for data in it:
+            first = last = Node(data)
+            break
+        else:
+            return None, None, 0
+        count = 1
+        for count, data in enumerate(it, 2):
+            node = Node(data)
+            node.next = first
+            first = node
+        return first, last, count
+
+    def extend(self, iterable):
+        first, last, count = self._link_chain(iterable)
+        if count == 0:
+            return
+        if self.tail:
+            self.tail.next = first
+        else:
+            self.head = first
+        self.tail = last
+        self.tail.next = self.head
+        self.size += count
+
+    def extendleft(self, iterable):
+        first, last, count = self._link_chain_reversed(iterable)
+        if count == 0:
+            return
+        if self.head:
+            last.next = self.head
+        else:
+            self.tail = last
+        self.head = first
+        self.tail.next = self.head
+        self.size += count
+
     def append(self, data):
         new_node = Node(data)
         if self.tail:
@@ -84,6 +146,18 @@ class CircularLinkedList:
         if flag is False:
                 print(f"Item not present in the list = {data}")
 
+    def rotate(self, k=1):
+        """Rotate k steps to the right, like collections.deque.rotate.
+
+        Only head and tail move. A singly linked ring can only be walked
+        forwards, so this costs O(n - k); rotate(-1) is O(1).
+        """
+        if self.size < 2:
+            return
+        for _ in range((-k) % self.size):
+            self.tail = self.head
+            self.head = self.head.next
+
     def iter(self):
         current = self.head
         while current:
@@ -92,6 +166,27 @@ class CircularLinkedList:
             yield val
 
 
+def benchmark_bulk_load(n=10**6):
+    """Load n items with repeated append() vs from_iterable()."""
+    values = range(n)
+    print(f"{'method':<20} {'seconds':>9}")
+    gc_was_enabled = gc.isenabled()
+    gc.disable()    # timed with the cyclic GC off, as timeit does
+    try:
+        start = time.perf_counter()
+        words = CircularLinkedList()
+        for value in values:
+            words.append(value)
+        print(f"{'append() per item':<20} {time.perf_counter() - start:>9.3f}")
+
+        start = time.perf_counter()
+        words = CircularLinkedList.from_iterable(values)
+        print(f"{'from_iterable()':<20} {time.perf_counter() - start:>9.3f}")
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
 # Appending and iterating through the circular linked list
 # words = CircularLinkedList()
 # words.append('spam')
@@ -107,28 +202,40 @@ class CircularLinkedList:
 #         break
 
 
-# delete a node from the circular linked list
-words = CircularLinkedList()
-words.append('eggs')
-words.append('ham')
-words.append('spam')
-words.append('foo')
-words.append('bar')
-print("Let us try to delete something that isn't in the list.")
-words.delete('socks')
-counter = 0
-for item in words.iter():
-    print(item)
-    counter += 1
-    if counter > 4:
-        break
-
-
-print("Let us delete something that is there.")
-words.delete('foo')
-counter = 0
-for item in words.iter():
-    print(item)
-    counter += 1
-    if counter > 3:
-        break
+# Bulk construction and extension
+# words = CircularLinkedList.from_iterable(['ham', 'spam'])
+# words.extendleft(['eggs'])
+# print(words.size, words.tail.next.data)
+# # → 3 eggs
+
+
+# Loading 1M items: append() per item vs from_iterable()
+# benchmark_bulk_load()
+
+
+if __name__ == "__main__":
+    # delete a node from the circular linked list
+    words = CircularLinkedList()
+    words.append('eggs')
+    words.append('ham')
+    words.append('spam')
+    words.append('foo')
+    words.append('bar')
+    print("Let us try to delete something that isn't in the list.")
+    words.delete('socks')
+    counter = 0
+    for item in words.iter():
+        print(item)
+        counter += 1
+        if counter > 4:
+            break
+
+
+    print("Let us delete something that is there.")
+    words.delete('foo')
+    counter = 0
+    for item in words.iter():
+        print(item)
+        counter += 1
+        if counter > 3:
+            break
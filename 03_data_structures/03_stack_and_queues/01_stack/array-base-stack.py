@@ -1,57 +1,186 @@
-size = 3
-data = [None] * size
-top = -1
-
-
-def push(value):
-    global top
-    if top >= size - 1:
-        print("Stack overflow")
-    else:
-        top = top + 1
-        data[top] = value
-
-def pop():
-    global top
-    if top == -1:
-        print("Stack Underflow")
-        return None
-    else:
-        value = data[top]
-        data[top] = None
-        top -= 1
+import importlib.util
+import time
+import tracemalloc
+from array import array
+from pathlib import Path
+
+
+class ArrayStack:
+    """Array-based stack that grows instead of overflowing.
+
+    `data` is preallocated and `top` indexes the last pushed item, as in the
+    fixed-size version. When the buffer is full it doubles. With
+    shrink=True it halves once it drops to a quarter full; the gap between
+    the two thresholds stops a push/pop pair at the boundary from resizing
+    every time. Pass an array typecode (e.g. 'd' or 'q') to keep numeric
+    payloads in a compact array.array instead of a list of objects.
+    """
+
+    def __init__(self, capacity=4, typecode=None, shrink=False):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.typecode = typecode
+        self.data = self._new_buffer(capacity)
+        self.top = -1
+        self.shrink = shrink
+        self.min_capacity = capacity
+
+    def _new_buffer(self, capacity):
+        if self.typecode:
+            return array(self.typecode, [0]) * capacity
+        return [None] * capacity
+
+    def _resize(self, capacity):
+        size = self.top + 1
+        buffer = self._new_buffer(capacity)
+        buffer[:size] = self.data[:size]
+        self.data = buffer
+
+    def _maybe_shrink(self):
+        capacity = len(self.data)
+        if not self.shrink or capacity <= self.min_capacity:
+            return
+        while capacity > self.min_capacity and self.top + 1 <= capacity // 4:
+            capacity = max(capacity // 2, self.min_capacity)
+        if capacity != len(self.data):
+            self._resize(capacity)
+
+    def __len__(self):
+        return self.top + 1
+
+    def push(self, value):
+        if self.top >= len(self.data) - 1:
+            self._resize(len(self.data) * 2)
+        self.top = self.top + 1
+        self.data[self.top] = value
+
+    def push_many(self, values):
+        values = list(values)
+        needed = self.top + 1 + len(values)
+        capacity = len(self.data)
+        if needed > capacity:
+            while capacity < needed:
+                capacity *= 2
+            self._resize(capacity)
+        start = self.top + 1
+        self.data[start:start + len(values)] = (
+            array(self.typecode, values) if self.typecode else values)
+        self.top += len(values)
+
+    def pop(self):
+        if self.top == -1:
+            print("Stack Underflow")
+            return None
+        value = self.data[self.top]
+        if not self.typecode:
+            self.data[self.top] = None
+        self.top -= 1
+        self._maybe_shrink()
         return value
 
-def peek():
-    global top
-    if top == -1:
-        print("Stack is empty")
-        return None
-    else:
-        return data[top]
+    def pop_many(self, k):
+        """Pop up to k items; they are returned in pop order (top first)."""
+        k = min(k, self.top + 1)
+        if k <= 0:
+            return []
+        start = self.top + 1 - k
+        values = list(self.data[start:self.top + 1])
+        values.reverse()
+        if not self.typecode:
+            self.data[start:self.top + 1] = [None] * k
+        self.top -= k
+        self._maybe_shrink()
+        return values
+
+    def peek(self):
+        if self.top == -1:
+            print("Stack is empty")
+            return None
+        return self.data[self.top]
+
+    def items(self):
+        return list(self.data[0:self.top + 1])
+
+
+def load_linked_list_stack():
+    # The hyphen in linkedlist-base-stack.py rules out a plain import.
+    path = Path(__file__).with_name('linkedlist-base-stack.py')
+    spec = importlib.util.spec_from_file_location('linkedlist_base_stack', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.stack
+
+
+def benchmark_stacks(n=10**6):
+    """n pushes then n pops, with the memory each stack holds at its peak."""
+    linked_stack = load_linked_list_stack()
+    values = list(range(n))
+    cases = [
+        ('linked-list stack', linked_stack, False),
+        ('ArrayStack', ArrayStack, False),
+        ("ArrayStack(typecode='q')", lambda: ArrayStack(typecode='q'), False),
+        ('ArrayStack push/pop_many', ArrayStack, True),
+    ]
+    print(f"{'stack':<28} {'seconds':>9} {'ops/sec':>13} {'bytes/item':>11}")
+    for label, make_stack, batched in cases:
+        s = make_stack()
+        tracemalloc.start()
+        start = time.perf_counter()
+        if batched:
+            for i in range(0, n, 1000):
+                s.push_many(values[i:i + 1000])
+        else:
+            for value in values:
+                s.push(value)
+        pushed = time.perf_counter() - start
+        used, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        start = time.perf_counter()
+        if batched:
+            while s.pop_many(1000):
+                pass
+        else:
+            for _ in range(n):
+                s.pop()
+        elapsed = pushed + time.perf_counter() - start
+        print(f"{label:<28} {elapsed:>9.3f} {2 * n / elapsed:>13,.0f} "
+              f"{used / n:>11.1f}")
+
+
+if __name__ == "__main__":
+    stack = ArrayStack(capacity=3)
+    stack.push('egg')
+    stack.push('ham')
+    stack.push('spam')
+
+    print(stack.items())
+
+    stack.push('bacon')     # no overflow: the buffer doubles to 6 slots
+    stack.push('sausage')
 
+    print(stack.items())
 
-push('egg')
-push('ham')
-push('spam')
+    print(stack.pop())
+    print(stack.items())
 
-print(data[0:top+1])
+    print(stack.pop())
+    print(stack.items())
 
-push('bacon')
-push('sausage')
+    print('Peek:', stack.peek())
 
-print(data[0:top+1])
+    print(stack.pop_many(2))
+    print(stack.items())
 
-print(pop())
-print(data[0:top+1])
+    print(stack.pop())
+    print(stack.items())
 
-print(pop())
-print(data[0:top+1])
 
-print('Peek:', peek())
+    # Numeric payloads in a typed array, shrinking as the stack empties
+    # numbers = ArrayStack(capacity=2, typecode='d', shrink=True)
+    # numbers.push_many([1.5, 2.5, 3.5, 4.5, 5.5])
+    # print(len(numbers.data), numbers.pop_many(4), len(numbers.data))
+    # # → 8 [5.5, 4.5, 3.5, 2.5] 2
 
-print(pop())
-print(data[0:top+1])
 
-print(pop())
-print(data[0 : top + 1])
\ No newline at end of file
+    # ArrayStack against the linked-list stack
+    # benchmark_stacks()
@@ -1,4 +1,5 @@
 class Node:
+    __slots__ = ('next', 'data')
     def __init__(self, data=None):
         self.next = None
         self.data = data
@@ -37,19 +38,19 @@ class stack:
             print('Stack is empty!')
 
 
-words = stack()
-words.push('egg')
-words.push('ham')
-words.push('spam')
+if __name__ == "__main__":
+    words = stack()
+    words.push('egg')
+    words.push('ham')
+    words.push('spam')
 
-words.pop()
-words.pop()
-words.pop()
-words.peek()
-words.pop()
-
-current = words.top
-while current:
-    print(current.data)
-    current = current.next
+    words.pop()
+    words.pop()
+    words.pop()
+    words.peek()
+    words.pop()
 
+    current = words.top
+    while current:
+        print(current.data)
+        current = current.next
@@ -1,4 +1,13 @@
+import os
+import re
+import time
+import tracemalloc
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+
 class Node:  
+    __slots__ = ('data', 'next')
     def __init__(self, data):  
         self.data = data  
         self.next = None  
@@ -118,20 +127,288 @@ def check_brackets(expression):
     return result
 
 
-sl = (
-    "{(foo)(bar)}[hello](((this)is)a)test",
-    "{(foo)(bar)}[hello](((this)is)atest",
-    "{(foo)(bar)}[hello](((this)is)a)test)))"
-)
+# Streaming variant. Brackets are coded as small integers so the stack is
+# an array('B') (one byte per open bracket) with a parallel array of stream
+# offsets; nothing else is kept between chunks, so memory depends on the
+# nesting depth, not on the size of the input.
+BRACKET_CODES = {'(': 1, '[': 2, '{': 3, ')': -1, ']': -2, '}': -3}
+BRACKET_CODES.update({ord(k): v for k, v in BRACKET_CODES.items()})
+BRACKET_CHARS = {1: '(', 2: '[', 3: '{', -1: ')', -2: ']', -3: '}'}
+BRACKET_RE = re.compile(r'[()\[\]{}]')
+BRACKET_RE_BYTES = re.compile(rb'[()\[\]{}]')
+
+
+def read_chunks(source, chunk_size=1 << 20):
+    """Yield chunks from a file object, a whole str/bytes or an iterable."""
+    if isinstance(source, (str, bytes)):
+        yield source
+    elif hasattr(source, 'read'):
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+    else:
+        yield from source
+
+
+def check_brackets_stream(source, chunk_size=1 << 20, max_remarks=20):
+    """check_brackets for input that does not fit in memory.
+
+    source is a file object (text or binary), a str/bytes, or any iterable
+    of chunks. Positions in the remarks are 1-based line:column. Only the
+    first max_remarks problems are described; the rest are counted.
+    """
+    kinds = array('B')
+    offsets = array('q')
+    # line/column of kinds[i] for the entries pushed in earlier chunks;
+    # entries from the current chunk are resolved when the chunk ends.
+    lines = array('q')
+    columns = array('q')
+    open_c = matched = problems = 0
+    remarks = []
+    line = 1            # line number at the start of the current chunk
+    line_start = 0      # stream offset of the first character of that line
+    base = 0            # stream offset of the current chunk
+
+    for chunk in read_chunks(source, chunk_size):
+        if isinstance(chunk, str):
+            pattern, newline = BRACKET_RE, '\n'
+        else:
+            pattern, newline = BRACKET_RE_BYTES, b'\n'
+
+        def position(offset):
+            pos = offset - base
+            newlines = chunk.count(newline, 0, pos)
+            if not newlines:
+                return f"{line}:{offset - line_start + 1}"
+            return f"{line + newlines}:{pos - chunk.rfind(newline, 0, pos)}"
+
+        # finditer jumps over the runs without brackets in C; line numbers
+        # are only worked out for brackets that are reported or still open
+        # at the end of the chunk.
+        for match in pattern.finditer(chunk):
+            pos = match.start()
+            code = BRACKET_CODES[chunk[pos]]
+            if code > 0:
+                kinds.append(code)
+                offsets.append(base + pos)
+                open_c += 1
+            elif not kinds:
+                problems += 1
+                if len(remarks) < max_remarks:
+                    remarks.append(f"Extra closing: {BRACKET_CHARS[code]} "
+                                   f"at {position(base + pos)}")
+            else:
+                last = kinds.pop()
+                last_offset = offsets.pop()
+                resolved = len(lines) > len(kinds)
+                if resolved:
+                    last_line = lines.pop()
+                    last_column = columns.pop()
+                if last == -code:
+                    matched += 1
+                    continue
+                problems += 1
+                if len(remarks) < max_remarks:
+                    opened = (f"{last_line}:{last_column}" if resolved
+                              else position(last_offset))
+                    remarks.append(f"Mismatch: {BRACKET_CHARS[last]} at "
+                                   f"{opened} vs {BRACKET_CHARS[code]} at "
+                                   f"{position(base + pos)}")
+
+        previous = 0
+        for i in range(len(lines), len(kinds)):
+            pos = offsets[i] - base
+            newlines = chunk.count(newline, previous, pos)
+            if newlines:
+                line += newlines
+                line_start = base + chunk.rfind(newline, previous, pos) + 1
+            previous = pos
+            lines.append(line)
+            columns.append(offsets[i] - line_start + 1)
+        newlines = chunk.count(newline, previous)
+        if newlines:
+            line += newlines
+            line_start = base + chunk.rfind(newline, previous) + 1
+        base += len(chunk)
+
+    if kinds:
+        problems += 1
+        if len(remarks) < max_remarks:
+            remarks.append(f"{len(kinds)} opening(s) not closed, innermost "
+                           f"{BRACKET_CHARS[kinds[-1]]} at "
+                           f"{lines[-1]}:{columns[-1]}")
+    if problems > len(remarks):
+        remarks.append(f"... {problems - len(remarks)} more problem(s)")
+
+    return {
+        "Open": open_c,
+        "Matched": matched,
+        "Unmatched": len(kinds),
+        "Remarks": remarks or ["✅ All matched"]
+    }
+
+
+def benchmark_stream(repeats=20_000):
+    """Whole-string check_brackets against the streaming checker."""
+    text = ('{\n "user": {\n  "name": "some name here",\n'
+            '  "tags": ["alpha", "beta"],\n  "point": (1, 2)\n }\n}\n'
+            * repeats)
+    step = 1 << 16
+    for label, run in (
+            ('check_brackets', lambda: check_brackets(text)),
+            ('check_brackets_stream', lambda: check_brackets_stream(
+                text[i:i + step] for i in range(0, len(text), step)))):
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+        # Peak memory on a second run: tracing slows the timed one down.
+        tracemalloc.start()
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{label:<22} {elapsed:8.3f}s  "
+              f"{len(text) / elapsed / 1e6:7.1f} MB/s  peak {peak:>9,} B")
 
-for s in sl:
-    print(f"\nExpression: {s}")
-    result = check_brackets(s)
-    for k, v in result.items():
-        if isinstance(v, list):
-            for line in v:
-                print(f"  → {line}")
+
+# Parallel variant. Matching is an associative reduction: a chunk reduces
+# to the closers it could not match (they belong to openers further left)
+# followed by the openers it left open. Chunks are reduced in worker
+# processes and the summaries merged left to right.
+class BracketSummary:
+    __slots__ = ('open', 'matched', 'remarks', 'closers', 'closer_offsets',
+                 'openers', 'opener_offsets')
+
+    def __init__(self):
+        self.open = 0
+        self.matched = 0
+        self.remarks = []               # (offset of the closer, text)
+        self.closers = array('b')       # unmatched closers, left to right
+        self.closer_offsets = array('q')
+        self.openers = array('B')       # open brackets, bottom to top
+        self.opener_offsets = array('q')
+
+    def close(self, code, offset):
+        """Apply one closer to the open brackets of this summary."""
+        if not self.openers:
+            self.closers.append(code)
+            self.closer_offsets.append(offset)
+            return
+        last = self.openers.pop()
+        self.opener_offsets.pop()
+        if last == -code:
+            self.matched += 1
+        else:
+            self.remarks.append((offset, f"Mismatch: {BRACKET_CHARS[last]} "
+                                         f"vs {BRACKET_CHARS[code]}"))
+
+    def merge(self, right):
+        """Absorb the summary of the chunk that follows this one."""
+        self.open += right.open
+        self.matched += right.matched
+        self.remarks.extend(right.remarks)
+        for code, offset in zip(right.closers, right.closer_offsets):
+            self.close(code, offset)
+        self.openers.extend(right.openers)
+        self.opener_offsets.extend(right.opener_offsets)
+        return self
+
+
+def reduce_brackets(chunk, base=0):
+    summary = BracketSummary()
+    pattern = BRACKET_RE if isinstance(chunk, str) else BRACKET_RE_BYTES
+    for match in pattern.finditer(chunk):
+        pos = match.start()
+        code = BRACKET_CODES[chunk[pos]]
+        if code > 0:
+            summary.openers.append(code)
+            summary.opener_offsets.append(base + pos)
+            summary.open += 1
         else:
-            print(f"{k}: {v}")
+            summary.close(code, base + pos)
+    return summary
+
+
+def check_brackets_parallel(text, workers=None, chunks_per_worker=4):
+    """check_brackets on a process pool; same result as the sequential one.
+
+    workers defaults to os.cpu_count(); workers=1 reduces in this process.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        summaries = [reduce_brackets(text)]
+    else:
+        step = -(-len(text) // (workers * chunks_per_worker)) or 1
+        bases = range(0, len(text), step)
+        with ProcessPoolExecutor(workers) as executor:
+            summaries = list(executor.map(
+                reduce_brackets, (text[i:i + step] for i in bases), bases))
+
+    total = BracketSummary()
+    for summary in summaries:
+        total.merge(summary)
+    remarks = total.remarks
+    for code, offset in zip(total.closers, total.closer_offsets):
+        remarks.append((offset, f"Extra closing: {BRACKET_CHARS[code]}"))
+    remarks.sort(key=lambda remark: remark[0])
+    remarks = [remark for _, remark in remarks]
+    unmatched = len(total.openers)
+    if unmatched > 0:
+        remarks.append(f"{unmatched} opening(s) not closed")
+
+    return {
+        "Open": total.open,
+        "Matched": total.matched,
+        "Unmatched": unmatched,
+        "Remarks": remarks or ["✅ All matched"]
+    }
+
+
+def benchmark_parallel(size=1 << 30, cores=(1, 2, 4, 8, 16)):
+    """Throughput of check_brackets_parallel on a size-byte input."""
+    block = ('{\n "user": {\n  "name": "some name here",\n'
+             '  "tags": ["alpha", "beta"],\n  "point": (1, 2)\n }\n}\n')
+    text = block * (size // len(block))
+    print(f"{len(text) / 1e6:.0f} MB, {os.cpu_count()} CPU(s) available")
+    baseline = None
+    for workers in cores:
+        start = time.perf_counter()
+        check_brackets_parallel(text, workers=workers)
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(f"{workers:>3} worker(s) {elapsed:8.2f}s "
+              f"{len(text) / elapsed / 1e6:8.1f} MB/s "
+              f"speedup {baseline / elapsed:5.2f}x")
+
+
+# Worker processes import this module, so the demo only runs as a script.
+if __name__ == "__main__":
+    sl = (
+        "{(foo)(bar)}[hello](((this)is)a)test",
+        "{(foo)(bar)}[hello](((this)is)atest",
+        "{(foo)(bar)}[hello](((this)is)a)test)))"
+    )
+
+    for s in sl:
+        print(f"\nExpression: {s}")
+        result = check_brackets(s)
+        for k, v in result.items():
+            if isinstance(v, list):
+                for line in v:
+                    print(f"  → {line}")
+            else:
+                print(f"{k}: {v}")
+
+
+    # Streaming from a file object, chunk by chunk
+    # with open('dump.json', 'rb') as f:
+    #     print(check_brackets_stream(f))
+    # print(check_brackets_stream(["{(foo)\n(ba", "r)}[\n", "hello)"]))
+    # → Mismatch: [ at 2:7 vs ) at 3:6
 
+    # Whole-string checker against the streaming one
+    # benchmark_stream()
 
+    # Scaling across processes (1 GB input by default)
+    # benchmark_parallel()
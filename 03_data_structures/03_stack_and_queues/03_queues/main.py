@@ -1,9 +1,18 @@
+import os
+import queue as stdlib_queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from queue import Empty, Full
+from random import Random, random
+
+
 # Queue implementation using a list
 class ListQueue:
-    def __init__(self):
+    def __init__(self, size=3):
         self.items = []
         self.front = self.rear = 0
-        self.size = 3
+        self.size = size
 
     def enqueue(self, data):
         if self.size == self.rear:
@@ -36,8 +45,104 @@ class ListQueue:
 # print(f"Dequeued: {q.items}")
 
 
+# Queue implementation using a circular buffer. The list is allocated up
+# front and front/rear wrap around it, so dequeue never shifts the items
+# the way list.pop(0) does. When the buffer is full it doubles in size,
+# unless the queue was created with growable=False.
+class RingBufferQueue:
+    def __init__(self, capacity=8, growable=True):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.items = [None] * capacity
+        self.front = self.rear = 0
+        self.count = 0
+        self.growable = growable
+
+    def __len__(self):
+        return self.count
+
+    def _grow(self):
+        # Unwrap the items into a buffer twice the size, oldest first.
+        capacity = len(self.items)
+        self.items = (self.items[self.front:] + self.items[:self.front]
+                      + [None] * capacity)
+        self.front = 0
+        self.rear = capacity
+
+    def enqueue(self, data):
+        if self.count == len(self.items):
+            if not self.growable:
+                print("Queue is full")
+                return
+            self._grow()
+        self.items[self.rear] = data
+        self.rear += 1
+        if self.rear == len(self.items):
+            self.rear = 0
+        self.count += 1
+
+    def dequeue(self):
+        if self.count == 0:
+            print('Queue is empty')
+            return None
+        data = self.items[self.front]
+        self.items[self.front] = None
+        self.front += 1
+        if self.front == len(self.items):
+            self.front = 0
+        self.count -= 1
+        return data
+
+    def peek(self):
+        if self.count == 0:
+            print('Queue is empty')
+            return None
+        return self.items[self.front]
+
+
+def benchmark_ring_buffer(sizes=(10**5, 10**6, 10**7), list_limit=10**5):
+    """n enqueues followed by n dequeues on each queue implementation.
+
+    ListQueue is skipped above `list_limit`, where pop(0) makes it O(n^2).
+    """
+    print(f"{'ops':>12} {'queue':<26} {'seconds':>9} {'ops/sec':>13}")
+    for n in sizes:
+        cases = [('RingBufferQueue', RingBufferQueue),
+                 ('RingBufferQueue(bounded)',
+                  lambda: RingBufferQueue(capacity=n, growable=False)),
+                 ('linked-list Queue', LinkedQueue)]
+        if n <= list_limit:
+            cases.insert(0, ('ListQueue', lambda: ListQueue(size=n)))
+        for label, make_queue in cases:
+            q = make_queue()
+            start = time.perf_counter()
+            for i in range(n):
+                q.enqueue(i)
+            for _ in range(n):
+                q.dequeue()
+            elapsed = time.perf_counter() - start
+            print(f"{2 * n:>12,} {label:<26} {elapsed:>9.3f} {2 * n / elapsed:>13,.0f}")
+
+
+# q = RingBufferQueue(capacity=2)
+# q.enqueue('egg')
+# q.enqueue('ham')
+# q.enqueue('spam')   # buffer doubles to 4 slots
+# print(q.dequeue(), q.peek(), len(q))
+# # → egg ham 2
+# q = RingBufferQueue(capacity=2, growable=False)
+# q.enqueue(1)
+# q.enqueue(2)
+# q.enqueue(3)        # → Queue is full
+
+
+# Ring buffer against ListQueue and the linked-list Queue
+# benchmark_ring_buffer()
+
+
 # Queue implementation using a doubly linked list
 class Node:
+    __slots__ = ('data', 'next', 'prev')
     def __init__(self, data=None, next=None, prev=None):
         self.data = data
         self.next = next
@@ -63,18 +168,20 @@ class Queue:
 
     def dequeue(self):
         if self.count == 1:
+            data = self.head.data
             self.count -= 1
             self.head = None
             self.tail = None
+            return data
         elif self.count > 1:
             data = self.head.data
             self.head = self.head.next
             self.head.prev = None
+            self.count -= 1
             return data
         elif self.count < 1:
             print('Queue is empty')
-        self.count -= 1
-    
+
     def iter(self):
         current = self.head
         while current:
@@ -82,6 +189,145 @@ class Queue:
             current = current.next
 
 
+# The two-stack Queue further down reuses the name `Queue`; keep a handle
+# on the linked-list version for code that needs it after that point.
+LinkedQueue = Queue
+
+
+# Thread-safe version of the linked-list Queue. One lock guards the list
+# and two conditions wake up waiting producers/consumers, the same scheme
+# queue.Queue uses. The *_many methods move a whole batch under a single
+# acquisition of the lock. Empty and Full are the queue module's own
+# exceptions, so callers can treat both classes the same way.
+class ThreadSafeQueue(Queue):
+    def __init__(self, maxsize=0):
+        super().__init__()
+        self.maxsize = maxsize
+        self.lock = threading.Lock()
+        self.not_empty = threading.Condition(self.lock)
+        self.not_full = threading.Condition(self.lock)
+
+    def __len__(self):
+        with self.lock:
+            return self.count
+
+    def _has_room(self):
+        return not self.maxsize or self.count < self.maxsize
+
+    def _has_items(self):
+        return self.count > 0
+
+    @staticmethod
+    def _remaining(deadline):
+        if deadline is None:
+            return None
+        return max(0.0, deadline - time.monotonic())
+
+    def put(self, data, timeout=None):
+        """Add an item, waiting up to `timeout` seconds for room."""
+        with self.not_full:
+            if not self.not_full.wait_for(self._has_room, timeout):
+                raise Full
+            self.enqueue(data)
+            self.not_empty.notify()
+
+    def get(self, timeout=None):
+        """Remove the oldest item, waiting up to `timeout` seconds for one."""
+        with self.not_empty:
+            if not self.not_empty.wait_for(self._has_items, timeout):
+                raise Empty
+            data = self.dequeue()
+            self.not_full.notify()
+            return data
+
+    def put_many(self, items, timeout=None):
+        """Add every item under one lock acquisition.
+
+        A bounded queue may fill up part-way; the lock is then released
+        only while waiting for consumers to make room.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self.not_full:
+            added = 0
+            for data in items:
+                if not self._has_room():
+                    self.not_empty.notify(added)
+                    added = 0
+                    if not self.not_full.wait_for(
+                            self._has_room, self._remaining(deadline)):
+                        raise Full
+                self.enqueue(data)
+                added += 1
+            self.not_empty.notify(added)
+
+    def get_many(self, max_items, timeout=None):
+        """Remove up to `max_items` items once at least one is available."""
+        with self.not_empty:
+            if not self.not_empty.wait_for(self._has_items, timeout):
+                raise Empty
+            items = []
+            for _ in range(min(max_items, self.count)):
+                items.append(self.dequeue())
+            self.not_full.notify(len(items))
+            return items
+
+
+def benchmark_threads(producers=4, consumers=4, items=200_000, batch=100):
+    """Multi-producer/multi-consumer throughput against queue.Queue."""
+
+    def run(make_queue, put, get, batched):
+        q = make_queue()
+        per_producer = items // producers
+
+        def produce():
+            if batched:
+                for start in range(0, per_producer, batch):
+                    put(q, range(start, min(start + batch, per_producer)))
+            else:
+                for i in range(per_producer):
+                    put(q, i)
+
+        def consume():
+            while True:
+                got = get(q)
+                if batched:
+                    stops = got.count(None)
+                    if stops:
+                        # Hand back any extra stop markers for the others.
+                        for _ in range(stops - 1):
+                            q.put(None)
+                        return
+                elif got is None:
+                    return
+
+        threads = [threading.Thread(target=consume) for _ in range(consumers)]
+        workers = [threading.Thread(target=produce) for _ in range(producers)]
+        start = time.perf_counter()
+        for thread in threads + workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+        for _ in range(consumers):
+            q.put(None)
+        for thread in threads:
+            thread.join()
+        return per_producer * producers / (time.perf_counter() - start)
+
+    cases = [
+        ('queue.Queue', lambda: stdlib_queue.Queue(maxsize=1000),
+         lambda q, x: q.put(x), lambda q: q.get(), False),
+        ('ThreadSafeQueue', lambda: ThreadSafeQueue(maxsize=1000),
+         lambda q, x: q.put(x), lambda q: q.get(), False),
+        (f'ThreadSafeQueue batch={batch}',
+         lambda: ThreadSafeQueue(maxsize=1000),
+         lambda q, xs: q.put_many(xs), lambda q: q.get_many(batch), True),
+    ]
+    print(f"{'queue':<28} {'items/sec':>12}")
+    for label, make_queue, put, get, batched in cases:
+        rate = run(make_queue, put, get, batched)
+        print(f"{label:<28} {rate:>12,.0f}")
+
+
 # q = Queue()
 # q.enqueue(1)
 # q.enqueue(2)
@@ -106,30 +352,344 @@ class Queue:
 #     print(f"Data: {n.data}")
 
 
+# Sharing the linked-list queue between threads
+# q = ThreadSafeQueue(maxsize=2)
+# q.put_many(['egg', 'ham'])
+# try:
+#     q.put('spam', timeout=0.1)
+# except Full:
+#     print("Queue is full")
+# print(q.get(), q.get_many(10))
+# # → egg ['ham']
 
-class Queue:
+
+# Producer/consumer throughput against queue.Queue
+# benchmark_threads()
+
+
+# Work-stealing deque on top of the linked-list Queue. The owner pushes and
+# pops at the tail (newest first, while its data is still warm) and thieves
+# take from the head (the oldest work), so the two ends only meet when the
+# deque is almost empty. Python has no atomic compare-and-swap to build the
+# lock-free version with, so each deque has its own lock; every worker still
+# mostly touches only its own lock rather than one shared by all.
+class WorkStealingDeque(LinkedQueue):
     def __init__(self):
+        super().__init__()
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return self.count
+
+    def push(self, data):
+        with self.lock:
+            self.enqueue(data)
+
+    def pop(self):
+        """Owner end: remove the newest item, or return None."""
+        with self.lock:
+            if self.count == 0:
+                return None
+            node = self.tail
+            self.tail = node.prev
+            if self.tail is None:
+                self.head = None
+            else:
+                self.tail.next = None
+            self.count -= 1
+            return node.data
+
+    def steal(self):
+        """Thief end: remove the oldest item, or return None."""
+        with self.lock:
+            if self.count == 0:
+                return None
+            return self.dequeue()
+
+
+def cpu_bound_job(n):
+    # Pure-Python arithmetic whose running time grows with n
+    return sum(i * i for i in range(n))
+
+
+class TaskScheduler:
+    """Runs submitted (fn, *args) tasks on `workers` worker threads.
+
+    With processes=True every worker thread hands its tasks to a
+    single-process pool of its own, so CPU-bound jobs run in parallel
+    while the scheduling itself stays in this process. Subclasses decide
+    where tasks are kept (_put) and which one a worker runs next
+    (_next_task).
+    """
+
+    def __init__(self, workers=None, processes=True):
+        self.workers = workers or os.cpu_count() or 1
+        self.processes = processes
+        self.submitted = 0
+        self.executed = [0] * self.workers
+        self.errors = {}
+
+    def _put(self, task):
+        raise NotImplementedError("Subclasses should implement this method")
+
+    def _next_task(self, index):
+        raise NotImplementedError("Subclasses should implement this method")
+
+    def submit(self, fn, *args):
+        self._put((self.submitted, fn, args))
+        self.submitted += 1
+
+    def run(self):
+        """Run every submitted task; results come back in submit order.
+
+        A task that raises does not stop its worker: the rest of the tasks
+        still run, and once they are done the exception of the earliest
+        submitted failing task is raised. `errors` maps the id of every
+        failed task to its exception.
+        """
+        results = [None] * self.submitted
+        self.executed = [0] * self.workers
+        self.errors = {}
+        executors = [ProcessPoolExecutor(1) if self.processes else None
+                     for _ in range(self.workers)]
+
+        def work(index):
+            executor = executors[index]
+            while True:
+                task = self._next_task(index)
+                if task is None:
+                    return
+                task_id, fn, args = task
+                try:
+                    if executor:
+                        results[task_id] = executor.submit(fn, *args).result()
+                    else:
+                        results[task_id] = fn(*args)
+                except Exception as error:
+                    self.errors[task_id] = error
+                self.executed[index] += 1
+
+        threads = [threading.Thread(target=work, args=(i,))
+                   for i in range(self.workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for executor in executors:
+            if executor:
+                executor.shutdown()
+        self.submitted = 0
+        if self.errors:
+            raise self.errors[min(self.errors)]
+        return results
+
+
+class WorkStealingScheduler(TaskScheduler):
+    """One WorkStealingDeque per worker; tasks are dealt out round-robin.
+
+    A worker runs its own tasks first and, once its deque is empty, steals
+    from the others starting at a random victim. steal=False keeps the
+    round-robin split as it is (static partitioning).
+    """
+
+    def __init__(self, workers=None, processes=True, steal=True):
+        super().__init__(workers, processes)
+        self.steal = steal
+        self.deques = [WorkStealingDeque() for _ in range(self.workers)]
+        self.steals = [0] * self.workers
+        self.random = Random()
+
+    def run(self):
+        self.steals = [0] * self.workers
+        return super().run()
+
+    def _put(self, task):
+        self.deques[self.submitted % self.workers].push(task)
+
+    def _next_task(self, index):
+        task = self.deques[index].pop()
+        if task is not None or not self.steal:
+            return task
+        # Tasks are all submitted before run(), so once every deque is
+        # found empty there is nothing left to steal.
+        first = self.random.randrange(self.workers)
+        for offset in range(self.workers):
+            victim = (first + offset) % self.workers
+            if victim != index:
+                task = self.deques[victim].steal()
+                if task is not None:
+                    self.steals[index] += 1
+                    return task
+        return None
+
+
+class SharedQueueScheduler(TaskScheduler):
+    """Every worker takes its next task from one ThreadSafeQueue."""
+
+    def __init__(self, workers=None, processes=True):
+        super().__init__(workers, processes)
+        self.queue = ThreadSafeQueue()
+
+    def _put(self, task):
+        self.queue.put(task)
+
+    def _next_task(self, index):
+        try:
+            return self.queue.get(timeout=0)
+        except Empty:
+            return None
+
+
+def benchmark_work_stealing(workers=4, tasks=64, base=200_000,
+                            processes=True, seed=7):
+    """Skewed cpu_bound_job sizes: static split vs stealing vs shared queue.
+
+    Sizes follow a Pareto distribution, so a few tasks are many times
+    larger than the rest. With processes=False the jobs run on the worker
+    threads themselves, which measures the scheduling overhead only.
+    """
+    rng = Random(seed)
+    sizes = [min(int(base * rng.paretovariate(1.2)), base * 50)
+             for _ in range(tasks)]
+    cases = [
+        ('static partition', lambda: WorkStealingScheduler(
+            workers, processes, steal=False)),
+        ('work stealing', lambda: WorkStealingScheduler(workers, processes)),
+        ('shared queue', lambda: SharedQueueScheduler(workers, processes)),
+    ]
+    print(f"{tasks} tasks, {workers} workers, "
+          f"largest/median size {max(sizes) / sorted(sizes)[tasks // 2]:.0f}x")
+    print(f"{'scheduler':<18} {'seconds':>8}  tasks per worker / steals")
+    for label, make_scheduler in cases:
+        scheduler = make_scheduler()
+        for n in sizes:
+            scheduler.submit(cpu_bound_job, n)
+        start = time.perf_counter()
+        scheduler.run()
+        elapsed = time.perf_counter() - start
+        steals = getattr(scheduler, 'steals', None)
+        print(f"{label:<18} {elapsed:>8.2f}  {scheduler.executed}"
+              f"{f' / {steals}' if steals else ''}")
+
+
+# Owner and thief ends of the deque
+# d = WorkStealingDeque()
+# for word in ('egg', 'ham', 'spam'):
+#     d.push(word)
+# print(d.pop(), d.steal(), len(d))
+# # → spam egg 1
+
+
+# Skewed CPU-bound jobs: static split vs work stealing vs a shared queue
+# benchmark_work_stealing()
+
+
+
+class Queue:
+    def __init__(self, on_transfer=None):
         self.Stack1 = []
         self.Stack2 = []
+        # Instrumentation: how many times Stack1 was moved into Stack2 and
+        # how many items that moved in total. `on_transfer`, if given, is
+        # called with the number of items moved by each transfer.
+        self.transfers = 0
+        self.transferred = 0
+        self.on_transfer = on_transfer
+
+    def __len__(self):
+        return len(self.Stack1) + len(self.Stack2)
+
+    def __bool__(self):
+        return bool(self.Stack1 or self.Stack2)
+
+    def __iter__(self):
+        # Queue order: Stack2 from its top, then Stack1 from its bottom.
+        yield from reversed(self.Stack2)
+        yield from self.Stack1
+
+    def _transfer(self):
+        # One reversed slice moves the whole of Stack1 at C speed instead
+        # of a pop()/append() pair per element.
+        moved = len(self.Stack1)
+        self.Stack2[:] = self.Stack1[::-1]
+        self.Stack1.clear()
+        self.transfers += 1
+        self.transferred += moved
+        if self.on_transfer:
+            self.on_transfer(moved)
 
     def enqueue(self, data):
         self.Stack1.append(data)
     
     def dequeue(self):
-        if not self.Stack2:
-            while self.Stack1:
-                self.Stack2.append(self.Stack1.pop())
+        if not self.Stack2 and self.Stack1:
+            self._transfer()
         if not self.Stack2:
             print("No Element to dequeue")
             return
         return self.Stack2.pop()
 
+    def dequeue_many(self, k):
+        """Remove up to k items, oldest first."""
+        items = []
+        while k > 0:
+            if not self.Stack2:
+                if not self.Stack1:
+                    break
+                self._transfer()
+            take = min(k, len(self.Stack2))
+            items.extend(self.Stack2[:-take - 1:-1])
+            del self.Stack2[-take:]
+            k -= take
+        return items
+
+    def peek(self):
+        if self.Stack2:
+            return self.Stack2[-1]
+        if self.Stack1:
+            return self.Stack1[0]
+        print("No Element to peek")
+        return None
+
+
+def report_transfers(ops=10**6, enqueue_share=0.6):
+    """Mixed enqueue/dequeue workload; moves per dequeue must stay <= 1."""
+    q = Queue()
+    dequeued = 0
+    start = time.perf_counter()
+    for i in range(ops):
+        if random() < enqueue_share or not q:
+            q.enqueue(i)
+        else:
+            q.dequeue()
+            dequeued += 1
+    elapsed = time.perf_counter() - start
+    dequeued += len(q.dequeue_many(len(q)))
+    print(f"ops: {ops:,}  seconds: {elapsed:.3f}")
+    print(f"transfers: {q.transfers:,}  items moved: {q.transferred:,}")
+    print(f"moves per dequeued item: {q.transferred / max(dequeued, 1):.3f}")
+
+
+if __name__ == "__main__":
+    queue = Queue()
+    queue.enqueue(23)
+    queue.enqueue(13)
+    queue.enqueue(11)
+    print(queue.Stack1)
+
+    queue.dequeue()
+    print(queue.Stack2)
+
+
+# q = Queue(on_transfer=lambda moved: print(f"moved {moved} items"))
+# for word in ('egg', 'ham', 'spam', 'bacon'):
+#     q.enqueue(word)
+# print(q.peek(), len(q), list(q))
+# # → egg 4 ['egg', 'ham', 'spam', 'bacon']
+# print(q.dequeue_many(3), q.transfers)
+# # → moved 4 items
+# # → ['egg', 'ham', 'spam'] 1
 
-queue = Queue()
-queue.enqueue(23)
-queue.enqueue(13)
-queue.enqueue(11)
-print(queue.Stack1)
 
-queue.dequeue()
-print(queue.Stack2)
\ No newline at end of file
+# Transfer counts under a mixed workload
+# report_transfers()
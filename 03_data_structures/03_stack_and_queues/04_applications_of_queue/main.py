@@ -1,7 +1,10 @@
+import asyncio
+import heapq
 from random import randint
 
 class Node(object):
     """ A Doubly-linked lists' node. """
+    __slots__ = ('data', 'next', 'prev')
     def __init__(self, data=None, next=None, prev=None):
         self.data = data
         self.next = next
@@ -42,15 +45,8 @@ class Queue(object):
         return current
 
 
-queue = Queue()
-
-import time
-start_time = time.time()
-for i in range(100000):
-    queue.enqueue(i)
-for i in range(100000):
-    queue.dequeue()
-print("--- %s seconds ---" % (time.time() - start_time))
+# Timing this Queue against the other queues of the chapter:
+# python ../queue_benchmark.py --only "applications Queue"
 
 
 class Track:
@@ -70,16 +66,293 @@ class MediaPlayerQueue(Queue):
             print("Now playing {}".format(current_track_node.data.title))
             time.sleep(current_track_node.data.length)
 
-track1 = Track("white whistle")
-track2 = Track("butter butter")
-track3 = Track("Oh black star")
-track4 = Track("Watch that chicken")
-track5 = Track("Don't go")
-
-media_player = MediaPlayerQueue()
-media_player.add_track(track1)
-media_player.add_track(track2)
-media_player.add_track(track3)
-media_player.add_track(track4)
-media_player.add_track(track5)
-media_player.play()
\ No newline at end of file
+
+class TrackTimers:
+    """One timer heap for every player driven by the same event loop.
+
+    Entries are (deadline, sequence, player, token). Only the earliest
+    deadline has a loop callback at any time, so thousands of players cost
+    one heap entry each instead of one sleeping coroutine each. Pausing or
+    skipping bumps the player's token; the stale entry is dropped when it
+    reaches the top of the heap.
+    """
+
+    def __init__(self, loop=None):
+        self.loop = loop or asyncio.get_running_loop()
+        self.heap = []
+        self.sequence = 0
+        self.handle = None
+        self.handle_deadline = None
+
+    def add(self, deadline, player, token):
+        self.sequence += 1
+        heapq.heappush(self.heap, (deadline, self.sequence, player, token))
+        if self.handle_deadline is None or deadline < self.handle_deadline:
+            self._arm()
+
+    def _arm(self):
+        if self.handle is not None:
+            self.handle.cancel()
+        if self.heap:
+            self.handle_deadline = self.heap[0][0]
+            self.handle = self.loop.call_at(self.handle_deadline, self._fire)
+        else:
+            self.handle = self.handle_deadline = None
+
+    def _fire(self):
+        now = self.loop.time()
+        while self.heap and self.heap[0][0] <= now:
+            _, _, player, token = heapq.heappop(self.heap)
+            player._timer_expired(token)
+        self.handle = None
+        self._arm()
+
+
+class AsyncMediaPlayerQueue(MediaPlayerQueue):
+    """MediaPlayerQueue that plays on an event loop instead of sleeping.
+
+    Tracks can be added while the queue is playing. Players that share a
+    TrackTimers share its heap; start() returns at once and finished()
+    waits until the queue runs dry.
+    """
+
+    def __init__(self, timers, name=None, verbose=True):
+        super().__init__()
+        self.timers = timers
+        self.name = name
+        self.verbose = verbose
+        self.current = None
+        self.remaining = 0
+        self.started_at = None
+        self.playing = False
+        self.paused = False
+        self.played = 0
+        self._token = 0
+        self._done = asyncio.Event()
+
+    def add_track(self, track):
+        self.enqueue(track)
+        self._done.clear()
+        if self.playing and self.current is None:
+            self._next_track()
+
+    def start(self):
+        self.playing = True
+        if self.current is None:
+            self._next_track()
+
+    def pause(self):
+        if self.current is None or self.paused:
+            return
+        self.remaining -= self.timers.loop.time() - self.started_at
+        self.paused = True
+        self._token += 1
+
+    def resume(self):
+        if self.paused:
+            self.paused = False
+            self._schedule()
+
+    def skip(self):
+        if not self.playing:
+            return      # nothing is playing before start()
+        self._token += 1
+        self.paused = False
+        self._next_track()
+
+    async def finished(self):
+        await self._done.wait()
+
+    def _next_track(self):
+        if self.count == 0:
+            self.current = None
+            self._done.set()
+            return
+        self.current = self.dequeue().data
+        self.remaining = self.current.length
+        self.played += 1
+        if self.verbose:
+            prefix = f"[{self.name}] " if self.name else ""
+            print("{}Now playing {}".format(prefix, self.current.title))
+        self._schedule()
+
+    def _schedule(self):
+        self._token += 1
+        self.started_at = self.timers.loop.time()
+        self.timers.add(self.started_at + self.remaining, self, self._token)
+
+    def _timer_expired(self, token):
+        if token == self._token and not self.paused:
+            self._next_track()
+
+
+async def play_many(players=10_000, tracks=5, speed=1000):
+    """Drive many players on one loop; speed divides every track length."""
+    timers = TrackTimers()
+    queues = []
+    for i in range(players):
+        player = AsyncMediaPlayerQueue(timers, name=i, verbose=False)
+        for j in range(tracks):
+            track = Track(f"track {j}")
+            track.length /= speed
+            player.add_track(track)
+        queues.append(player)
+    start = time.perf_counter()
+    for player in queues:
+        player.start()
+    await asyncio.gather(*(player.finished() for player in queues))
+    elapsed = time.perf_counter() - start
+    played = sum(player.played for player in queues)
+    print(f"{players} players, {played} tracks in {elapsed:.2f}s "
+          f"(longest queue {tracks * 10 / speed:.2f}s of audio)")
+
+
+
+class UserTracks:
+    """One user's tracks: a FIFO Queue per priority level.
+
+    `levels` maps a priority to its Queue and `priorities` is a heap of the
+    negated priorities that have tracks, so the highest level is on top.
+    """
+    __slots__ = ('user', 'weight', 'levels', 'priorities', 'count', 'vtime')
+
+    def __init__(self, user, weight=1):
+        if weight <= 0:
+            raise ValueError("weight must be positive")
+        self.user = user
+        self.weight = weight
+        self.levels = {}
+        self.priorities = []
+        self.count = 0
+        self.vtime = 0      # virtual time this user has been served up to
+
+    def add(self, track, priority):
+        level = self.levels.get(priority)
+        if level is None:
+            level = self.levels[priority] = Queue()
+            heapq.heappush(self.priorities, -priority)
+        level.enqueue(track)
+        self.count += 1
+
+    def pop(self):
+        priority = -self.priorities[0]
+        level = self.levels[priority]
+        track = level.dequeue().data
+        if level.count == 0:
+            heapq.heappop(self.priorities)
+            del self.levels[priority]
+        self.count -= 1
+        return track
+
+
+class FairMediaPlayerQueue(MediaPlayerQueue):
+    """MediaPlayerQueue shared by several users.
+
+    Every user has a subqueue with priority levels (UserTracks). Users take
+    turns by weighted fair queuing: playing a track advances the user's
+    virtual time by length / weight and the user with the lowest virtual
+    time goes next, so a user with weight 2 gets twice the listening time
+    of a user with weight 1. A user whose subqueue was empty rejoins at the
+    current virtual time instead of cashing in the time they were idle.
+
+    add_track is O(log n), play_next puts a track ahead of everything else
+    in O(1), and dequeue() still returns a Node, so play() and the
+    add_track(track) call of MediaPlayerQueue work as before.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.users = {}
+        self.active = []        # heap of (vtime, sequence, UserTracks)
+        self.sequence = 0
+        self.virtual_time = 0
+        self.up_next = Queue()
+
+    def set_weight(self, user, weight):
+        if weight <= 0:
+            raise ValueError("weight must be positive")
+        self._user_tracks(user).weight = weight
+
+    def _user_tracks(self, user):
+        tracks = self.users.get(user)
+        if tracks is None:
+            tracks = self.users[user] = UserTracks(user)
+        return tracks
+
+    def _activate(self, tracks):
+        self.sequence += 1
+        heapq.heappush(self.active, (tracks.vtime, self.sequence, tracks))
+
+    def add_track(self, track, user=None, priority=0):
+        tracks = self._user_tracks(user)
+        if tracks.count == 0:
+            tracks.vtime = max(tracks.vtime, self.virtual_time)
+            self._activate(tracks)
+        tracks.add(track, priority)
+        self.count += 1
+
+    def enqueue(self, data):
+        self.add_track(data)
+
+    def play_next(self, track):
+        self.up_next.enqueue(track)
+        self.count += 1
+
+    def dequeue(self):
+        if self.count == 0:
+            return None
+        self.count -= 1
+        if self.up_next.count:
+            return self.up_next.dequeue()
+        vtime, _, tracks = heapq.heappop(self.active)
+        self.virtual_time = vtime
+        track = tracks.pop()
+        tracks.vtime = vtime + track.length / tracks.weight
+        if tracks.count:
+            self._activate(tracks)
+        return Node(track)
+
+
+if __name__ == "__main__":
+    track1 = Track("white whistle")
+    track2 = Track("butter butter")
+    track3 = Track("Oh black star")
+    track4 = Track("Watch that chicken")
+    track5 = Track("Don't go")
+
+    media_player = MediaPlayerQueue()
+    media_player.add_track(track1)
+    media_player.add_track(track2)
+    media_player.add_track(track3)
+    media_player.add_track(track4)
+    media_player.add_track(track5)
+    media_player.play()
+
+
+# The same playlist without blocking: pause, skip and add while playing
+# async def main():
+#     player = AsyncMediaPlayerQueue(TrackTimers())
+#     for track in (track1, track2, track3):
+#         player.add_track(track)
+#     player.start()
+#     await asyncio.sleep(2)
+#     player.pause()
+#     await asyncio.sleep(1)
+#     player.resume()
+#     player.skip()
+#     player.add_track(track4)
+#     await player.finished()
+# asyncio.run(main())
+
+# Thousands of players sharing one event loop and one timer heap
+# asyncio.run(play_many())
+
+# Several users sharing one player; alice gets twice bob's listening time
+# fair = FairMediaPlayerQueue()
+# fair.set_weight('alice', 2)
+# for i in range(4):
+#     fair.add_track(Track(f"alice {i}"), user='alice')
+#     fair.add_track(Track(f"bob {i}"), user='bob')
+# fair.add_track(Track("bob's favourite"), user='bob', priority=1)
+# fair.play_next(Track("announcement"))
+# fair.play()
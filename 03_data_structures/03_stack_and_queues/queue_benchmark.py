@@ -0,0 +1,163 @@
+"""Every queue in this chapter through the same workloads.
+
+Queues come from 03_queues/main.py (ListQueue, RingBufferQueue, the
+doubly-linked LinkedQueue, ThreadSafeQueue and the two-stack Queue) and from
+04_applications_of_queue/main.py (the applications Queue). Both modules are
+imported by path; their demos sit under `if __name__ == "__main__":`.
+
+Workloads
+    burst        enqueue a burst of items, then dequeue all of them
+    interleaved  alternate enqueue and dequeue around an empty queue
+    steady-D     keep D items queued: every enqueue is paired with a dequeue
+
+For each queue and workload the ops are run a few times for warm-up, then
+timed `repeats` times with perf_counter_ns (the median run gives ops/sec).
+A separate pass times each op on its own for the p50/p99 latencies, and a
+third pass runs under tracemalloc for the peak memory, so neither the
+per-op timer nor tracing slows down the throughput runs.
+
+    python queue_benchmark.py --ops 100000 --json results.json
+"""
+import argparse
+import importlib.util
+import json
+import tracemalloc
+from pathlib import Path
+from time import perf_counter_ns
+
+HERE = Path(__file__).resolve().parent
+
+
+def load_module(path):
+    spec = importlib.util.spec_from_file_location(path.parent.name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_queues():
+    queues = load_module(HERE / '03_queues/main.py')
+    applications = load_module(HERE / '04_applications_of_queue/main.py')
+    # (label, factory, name of the add method, name of the remove method)
+    return [
+        ('ListQueue', lambda: queues.ListQueue(size=float('inf')),
+         'enqueue', 'dequeue'),
+        ('RingBufferQueue', queues.RingBufferQueue, 'enqueue', 'dequeue'),
+        ('LinkedQueue', queues.LinkedQueue, 'enqueue', 'dequeue'),
+        ('ThreadSafeQueue', queues.ThreadSafeQueue, 'put', 'get'),
+        ('two-stack Queue', queues.Queue, 'enqueue', 'dequeue'),
+        ('applications Queue', applications.Queue, 'enqueue', 'dequeue'),
+    ]
+
+
+def workloads(ops, depths=(10, 1_000, 100_000), burst=1_000):
+    """[(name, prefill, ops)], ops being a list of True (add) / False."""
+    pattern = [True] * burst + [False] * burst
+    result = [
+        ('burst', 0, pattern * (ops // len(pattern))),
+        ('interleaved', 0, [True, False] * (ops // 2)),
+    ]
+    for depth in depths:
+        result.append((f'steady-{depth}', depth, [True, False] * (ops // 2)))
+    return result
+
+
+def prepared(factory, add_name, remove_name, prefill):
+    queue = factory()
+    add = getattr(queue, add_name)
+    for i in range(prefill):
+        add(i)
+    return queue, add, getattr(queue, remove_name)
+
+
+def run_ops(add, remove, ops):
+    start = perf_counter_ns()
+    for i, is_add in enumerate(ops):
+        if is_add:
+            add(i)
+        else:
+            remove()
+    return perf_counter_ns() - start
+
+
+def op_latencies(add, remove, ops):
+    latencies = [0] * len(ops)
+    for i, is_add in enumerate(ops):
+        if is_add:
+            start = perf_counter_ns()
+            add(i)
+        else:
+            start = perf_counter_ns()
+            remove()
+        latencies[i] = perf_counter_ns() - start
+    return latencies
+
+
+def percentile(sorted_values, fraction):
+    return sorted_values[min(len(sorted_values) - 1,
+                             int(fraction * len(sorted_values)))]
+
+
+def measure(factory, add_name, remove_name, prefill, ops, repeats, warmups):
+    def fresh():
+        return prepared(factory, add_name, remove_name, prefill)
+
+    for _ in range(warmups):
+        _, add, remove = fresh()
+        run_ops(add, remove, ops)
+    times = []
+    for _ in range(repeats):
+        _, add, remove = fresh()
+        times.append(run_ops(add, remove, ops))
+    times.sort()
+    median_ns = times[len(times) // 2]
+
+    _, add, remove = fresh()
+    latencies = sorted(op_latencies(add, remove, ops))
+
+    tracemalloc.start()
+    _, add, remove = fresh()
+    run_ops(add, remove, ops)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'ops': len(ops),
+        'ops_per_sec': len(ops) * 1e9 / median_ns,
+        'median_run_ms': median_ns / 1e6,
+        'p50_ns': percentile(latencies, 0.50),
+        'p99_ns': percentile(latencies, 0.99),
+        'peak_bytes': peak,
+    }
+
+
+def main(ops=100_000, repeats=5, warmups=1, json_path=None, only=None):
+    results = []
+    print(f"{'queue':<20} {'workload':<14} {'ops/sec':>12} "
+          f"{'p50 ns':>8} {'p99 ns':>8} {'peak KiB':>10}")
+    for label, factory, add_name, remove_name in load_queues():
+        if only and label not in only:
+            continue
+        for workload, prefill, op_list in workloads(ops):
+            row = measure(factory, add_name, remove_name, prefill, op_list,
+                          repeats, warmups)
+            row.update(queue=label, workload=workload, prefill=prefill)
+            results.append(row)
+            print(f"{label:<20} {workload:<14} {row['ops_per_sec']:>12,.0f} "
+                  f"{row['p50_ns']:>8} {row['p99_ns']:>8} "
+                  f"{row['peak_bytes'] / 1024:>10,.1f}")
+    if json_path:
+        Path(json_path).write_text(json.dumps(results, indent=2))
+        print(f"wrote {json_path}")
+    return results
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--ops', type=int, default=100_000)
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--warmups', type=int, default=1)
+    parser.add_argument('--json', dest='json_path')
+    parser.add_argument('--only', nargs='*',
+                        help="queue labels to run, e.g. LinkedQueue")
+    main(**vars(parser.parse_args()))
@@ -0,0 +1,301 @@
+"""Compile postfix/prefix expressions into a flat stack-machine program.
+
+postfix-expression-tree.py and prefix-expression-tree.py build a TreeNode
+tree and walk it with the recursive calc() each time. Here an expression is
+compiled once into `code`, a flat tuple of instructions
+
+    (function, left_mode, left, right_mode, right)
+
+where each operand is a constant (CONST, the value is in the instruction),
+a variable (VAR, looked up by name) or the result of an earlier
+instruction (STACK, popped off the stack). Fetching leaf operands inside
+the instruction, rather than with separate push instructions, halves the
+number of trips round the loop. run_code() runs the program with a loop
+and a list for the stack: no recursion and no tree to walk. Operators
+whose operands are both constants are folded while compiling, and
+compile_expression() keeps the most recently used programs in an LRU
+cache keyed by the source string.
+
+The program is also turned into Python source once, e.g.
+
+    def expression(variables):
+        v0 = variables['x']
+        return ((v0 + 5) * v0)
+
+and compiled to a function, so evaluate() makes a single call instead of
+one trip round the loop per instruction. run_code() stays the fallback
+for programs that have no Python form: inf or nan constants, and nesting
+deeper than the parser takes.
+
+    python expression_compiler.py     # throughput against calc()
+"""
+import importlib.util
+import math
+import operator
+import time
+from functools import lru_cache
+from pathlib import Path
+
+CONST, VAR, STACK = 0, 1, 2
+OPERATORS = {
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': operator.truediv,
+}
+SYMBOLS = {function: symbol for symbol, function in OPERATORS.items()}
+
+
+def _left(left, right):
+    # Program of a lone operand, e.g. "x": one instruction returning it.
+    return left
+
+
+class CompiledExpression:
+    __slots__ = ('code', 'variables', 'source', 'function')
+
+    def __init__(self, code, variables, source=None, function=None):
+        self.code = code            # tuple of instructions, run in order
+        self.variables = variables  # names the expression needs, sorted
+        self.source = source
+        self.function = function    # same result in one call, or None
+
+    def __call__(self, **variables):
+        return evaluate(self, variables)
+
+    def __repr__(self):
+        return f"CompiledExpression({self.source!r})"
+
+
+def parse_operand(token):
+    for convert in (int, float):
+        try:
+            return convert(token)
+        except ValueError:
+            pass
+    if token.isidentifier():
+        return token
+    raise ValueError(f"not a number, variable or operator: {token!r}")
+
+
+# While compiling, every operand is (mode, value, code): a leaf has an
+# empty code list, a sub-expression has mode STACK and the instructions
+# that leave its result on the stack.
+def _leaf(token):
+    value = parse_operand(token)
+    return (VAR if isinstance(value, str) else CONST), value, []
+
+
+def _combine(symbol, left, right):
+    function = OPERATORS[symbol]
+    left_mode, left_value, left_code = left
+    right_mode, right_value, right_code = right
+    if left_mode == CONST and right_mode == CONST:
+        try:
+            return CONST, function(left_value, right_value), []
+        except ZeroDivisionError:
+            pass    # leave it to raise when the expression is evaluated
+    code = left_code + right_code
+    code.append((function, left_mode, left_value, right_mode, right_value))
+    return STACK, None, code
+
+
+def _program(operands, source):
+    if len(operands) != 1:
+        raise ValueError(f"malformed expression: {source!r}")
+    mode, value, code = operands[0]
+    if mode != STACK:
+        code = [(_left, mode, value, CONST, None)]
+    names = set()
+    for _, left_mode, left, right_mode, right in code:
+        if left_mode == VAR:
+            names.add(left)
+        if right_mode == VAR:
+            names.add(right)
+    variables = tuple(sorted(names))
+    return CompiledExpression(tuple(code), variables, source,
+                              _as_function(code, variables, source))
+
+
+def _literal(value):
+    # repr() reads back as the same number, except for inf and nan.
+    if type(value) is int or (type(value) is float and math.isfinite(value)):
+        text = repr(value)
+        return f"({text})" if text.startswith('-') else text
+    return None
+
+
+def _as_function(code, variables, source):
+    """A Python function computing what `code` computes, or None."""
+    # Variables become locals v0, v1, ... so no name in the expression can
+    # clash with a keyword or with the parameter.
+    slots = {name: f"v{i}" for i, name in enumerate(variables)}
+    stack = []
+
+    def operand(mode, value):
+        if mode == STACK:
+            return stack.pop()
+        if mode == VAR:
+            return slots[value]
+        return _literal(value)
+
+    for function, left_mode, left, right_mode, right in code:
+        if function is _left:
+            stack.append(operand(left_mode, left))
+        else:
+            # Popped in the same order as run_code(): right, then left.
+            right = operand(right_mode, right)
+            left = operand(left_mode, left)
+            if left is None or right is None:
+                return None
+            stack.append(f"({left} {SYMBOLS[function]} {right})")
+    if stack[0] is None:
+        return None
+    lines = ["def expression(variables):"]
+    lines += [f"    {slot} = variables[{name!r}]"
+              for name, slot in slots.items()]
+    lines.append(f"    return {stack[0]}")
+    namespace = {}
+    try:
+        exec(compile('\n'.join(lines), f"<expression {source!r}>", 'exec'),
+             namespace)
+    except (SyntaxError, RecursionError, MemoryError):
+        return None     # too deeply nested for the parser
+    return namespace['expression']
+
+
+def compile_postfix(tokens):
+    """Compile a postfix token list, e.g. '4 5 + x 3 - *'.split()."""
+    operands = []
+    try:
+        for token in tokens:
+            if token in OPERATORS:
+                right = operands.pop()
+                left = operands.pop()
+                operands.append(_combine(token, left, right))
+            else:
+                operands.append(_leaf(token))
+    except IndexError:
+        raise ValueError(f"malformed expression: {' '.join(tokens)!r}")
+    return _program(operands, ' '.join(tokens))
+
+
+def compile_prefix(tokens):
+    """Compile a prefix token list, e.g. '* + 4 5 - x 3'.split().
+
+    Tokens are read right to left, as in build_tree_from_prefix; the
+    program is the same as for the equivalent postfix expression.
+    """
+    operands = []
+    try:
+        for token in reversed(tokens):
+            if token in OPERATORS:
+                left = operands.pop()
+                right = operands.pop()
+                operands.append(_combine(token, left, right))
+            else:
+                operands.append(_leaf(token))
+    except IndexError:
+        raise ValueError(f"malformed expression: {' '.join(tokens)!r}")
+    return _program(operands, ' '.join(tokens))
+
+
+@lru_cache(maxsize=1024)
+def compile_expression(source, notation='postfix'):
+    """Compiled program for a source string, cached per (source, notation)."""
+    tokens = source.split()
+    if notation == 'postfix':
+        return compile_postfix(tokens)
+    if notation == 'prefix':
+        return compile_prefix(tokens)
+    raise ValueError(f"unknown notation: {notation!r}")
+
+
+def evaluate(program, variables=None):
+    """Run a compiled program; variables maps names to values."""
+    if program.function is not None:
+        return program.function(variables)
+    return run_code(program, variables)
+
+
+def run_code(program, variables=None):
+    """Run the instructions of a program on a stack, one at a time."""
+    stack = []
+    push = stack.append
+    pop = stack.pop
+    for function, left_mode, left, right_mode, right in program.code:
+        # The right operand was pushed last, so it is popped first.
+        if right_mode == VAR:
+            right = variables[right]
+        elif right_mode == STACK:
+            right = pop()
+        if left_mode == VAR:
+            left = variables[left]
+        elif left_mode == STACK:
+            left = pop()
+        push(function(left, right))
+    return stack[0]
+
+
+def load_script(filename):
+    """Import a sibling script whose hyphenated name rules out `import`."""
+    path = Path(__file__).resolve().with_name(filename)
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def benchmark_compiled(evaluations=200_000):
+    """Evaluations per second: tree + recursive calc() vs compiled code."""
+    postfix = load_script('postfix-expression-tree.py')
+    build, calc = postfix.build_tree_from_postfix, postfix.calc
+    source = "x 5 + y 3 - * x y * + 2 /"
+    tokens = source.split()
+    bindings = [{'x': i % 100, 'y': i % 7} for i in range(evaluations)]
+
+    def tree_per_call():
+        # What the scripts do today: substitute, build, walk.
+        for b in bindings:
+            calc(build([str(b.get(t, t)) for t in tokens]))
+
+    def calc_only():
+        # The tree walk alone, on a tree built once (no variables).
+        root = build([str(bindings[0].get(t, t)) for t in tokens])
+        for _ in bindings:
+            calc(root)
+
+    def stack_loop():
+        program = compile_expression(source)
+        for b in bindings:
+            run_code(program, b)
+
+    def compiled():
+        program = compile_expression(source)
+        for b in bindings:
+            evaluate(program, b)
+
+    def cached_lookup():
+        for b in bindings:
+            evaluate(compile_expression(source), b)
+
+    cases = [
+        ('build tree + calc() per call', tree_per_call),
+        ('calc() on a prebuilt tree', calc_only),
+        ('stack program, run_code()', stack_loop),
+        ('Python function, evaluate()', compiled),
+        ('compile_expression() + evaluate()', cached_lookup),
+    ]
+    print(f"{source!r}, {evaluations:,} evaluations")
+    for label, run in cases:
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+        print(f"{label:<36} {evaluations / elapsed:>12,.0f} evals/sec")
+
+
+if __name__ == '__main__':
+    program = compile_expression("* + 4 5 - x 3", notation='prefix')
+    print(len(program.code), program.variables)   # 4 5 + was folded to 9
+    print(program(x=5))                           # -> 18
+    benchmark_compiled()
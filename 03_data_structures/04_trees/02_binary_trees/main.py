@@ -1,5 +1,6 @@
 from collections import deque
 class Node:
+    __slots__ = ('data', 'right_child', 'left_child')
     def __init__(self, data):
         self.data = data
         self.right_child = None
@@ -11,22 +12,6 @@ class Node:
 # n3 = Node('Right Child')
 # n4 = Node('Left Grandchild')
 
-A = Node('A')
-B = Node('B')
-C = Node('C')
-D = Node('D')
-E = Node('E')
-F = Node('F')
-G = Node('G')
-H = Node('H')
-
-A.left_child = B
-A.right_child = C
-B.left_child = D
-B.right_child = E
-D.left_child = G
-D.right_child = H
-C.right_child = F
 
 def inorder(root_node):
     current = root_node
@@ -36,10 +21,6 @@ def inorder(root_node):
     print(current.data)
     inorder(current.right_child)
 
-print('-'*30)
-print("In-order Traversal:")
-inorder(A)
-print('-'*30)
 
 def pre_order(root_node):
     current = root_node
@@ -49,11 +30,6 @@ def pre_order(root_node):
     pre_order(current.left_child)
     pre_order(current.right_child)
 
-print('-'*30)
-print("Pre-order Traversal:")
-pre_order(A)
-print('-'*30)
-
 
 def post_order(root_node):
     current = root_node
@@ -64,10 +40,6 @@ def post_order(root_node):
     print(current.data)
 
 
-print("Post-order Traversal:")
-post_order(A)
-print('-'*30)
-
 def level_order_traversal(rode_node):
     list_of_nodes = []
     traversal_queue = deque([rode_node])
@@ -76,14 +48,142 @@ def level_order_traversal(rode_node):
         list_of_nodes.append(node.data)
         if node.left_child:
             traversal_queue.append(node.left_child)
-            if node.right_child:
-                traversal_queue.append(node.right_child)
+        if node.right_child:
+            traversal_queue.append(node.right_child)
     return list_of_nodes
 
 
-print("Level-order Traversal:")
-print(level_order_traversal(A))
-print('-'*30)
+# Iterative traversals. An explicit stack replaces the call stack, so a
+# degenerate (list-shaped) tree of any depth works, and each one is a
+# generator: data comes out lazily instead of being printed.
+def inorder_iter(root_node):
+    stack = []
+    current = root_node
+    while stack or current:
+        while current:
+            stack.append(current)
+            current = current.left_child
+        current = stack.pop()
+        yield current.data
+        current = current.right_child
+
+
+def pre_order_iter(root_node):
+    stack = [root_node] if root_node else []
+    while stack:
+        node = stack.pop()
+        yield node.data
+        # Right first, so the left subtree comes off the stack first
+        if node.right_child:
+            stack.append(node.right_child)
+        if node.left_child:
+            stack.append(node.left_child)
 
-#     print(current.data)
-#     current = current.left_child
+
+def post_order_iter(root_node):
+    stack = []
+    current = root_node
+    last_visited = None
+    while stack or current:
+        if current:
+            stack.append(current)
+            current = current.left_child
+        else:
+            node = stack[-1]
+            if node.right_child and last_visited is not node.right_child:
+                current = node.right_child
+            else:
+                yield node.data
+                last_visited = stack.pop()
+
+
+def morris_inorder(root_node):
+    """In-order with O(1) extra space (Morris traversal).
+
+    Instead of a stack, the rightmost node of each left subtree is
+    temporarily pointed back at its in-order successor; the link is
+    removed on the second visit. The tree must not be modified while the
+    generator is running. If it is closed early, it finishes the walk
+    without yielding so that every temporary link is removed.
+    """
+    current = root_node
+    closed = False
+    while current:
+        if current.left_child is None:
+            if not closed:
+                try:
+                    yield current.data
+                except GeneratorExit:
+                    closed = True
+            current = current.right_child
+            continue
+        predecessor = current.left_child
+        while predecessor.right_child and predecessor.right_child is not current:
+            predecessor = predecessor.right_child
+        if predecessor.right_child is None:
+            predecessor.right_child = current       # thread back to current
+            current = current.left_child
+        else:
+            predecessor.right_child = None          # second visit: unthread
+            if not closed:
+                try:
+                    yield current.data
+                except GeneratorExit:
+                    closed = True
+            current = current.right_child
+
+
+if __name__ == "__main__":
+    A = Node('A')
+    B = Node('B')
+    C = Node('C')
+    D = Node('D')
+    E = Node('E')
+    F = Node('F')
+    G = Node('G')
+    H = Node('H')
+
+    A.left_child = B
+    A.right_child = C
+    B.left_child = D
+    B.right_child = E
+    D.left_child = G
+    D.right_child = H
+    C.right_child = F
+
+    print('-'*30)
+    print("In-order Traversal:")
+    inorder(A)
+    print('-'*30)
+
+    print('-'*30)
+    print("Pre-order Traversal:")
+    pre_order(A)
+    print('-'*30)
+
+    print("Post-order Traversal:")
+    post_order(A)
+    print('-'*30)
+
+    print("Level-order Traversal:")
+    print(level_order_traversal(A))
+    print('-'*30)
+
+
+    print("Iterative Traversals:")
+    print(list(inorder_iter(A)))
+    print(list(pre_order_iter(A)))
+    print(list(post_order_iter(A)))
+    print(list(morris_inorder(A)))
+    print('-'*30)
+
+    # A list-shaped tree far deeper than the recursion limit
+    # chain = Node(0)
+    # current = chain
+    # for i in range(1, 100_000):
+    #     current.right_child = Node(i)
+    #     current = current.right_child
+    # print(sum(inorder_iter(chain)), sum(morris_inorder(chain)))
+
+    #     print(current.data)
+    #     current = current.left_child
@@ -11,6 +11,7 @@ class Stack:
 
 
 class TreeNode:
+    __slots__ = ('data', 'right', 'left')
     def __init__(self, data=None):
         self.data = data
         self.right = None
@@ -28,19 +29,28 @@ def calc(node):
     else:
         return node.data
 
-expr = "4 5 + 5 3 - *".split()
-# ['4', '5', '+', '5', '3', '-', '*']
-stack = Stack()
+def build_tree_from_postfix(postfix_tokens):
+    stack = Stack()
+    for term in postfix_tokens:
+        if term in "+-*/":
+            node = TreeNode(term)
+            node.right = stack.pop()
+            node.left = stack.pop()
+        else:
+            node = TreeNode(int(term))
+        stack.push(node)
+    return stack.pop()
 
-for term in expr:
-    if term in "+-*/":
-        node = TreeNode(term)
-        node.right = stack.pop()
-        node.left = stack.pop()
-    else:
-        node = TreeNode(int(term))
-    stack.push(node)
 
-root = stack.pop()
-result = calc(root)
-print(result)
\ No newline at end of file
+if __name__ == "__main__":
+    expr = "4 5 + 5 3 - *".split()
+    # ['4', '5', '+', '5', '3', '-', '*']
+    root = build_tree_from_postfix(expr)
+    result = calc(root)
+    print(result)
+
+    # Evaluating the same formula many times with different variables:
+    # compile it once into a flat stack-machine program (expression_compiler.py)
+    # from expression_compiler import compile_expression
+    # program = compile_expression("x 5 + y 3 - *")
+    # print(program(x=4, y=5))  # -> 18
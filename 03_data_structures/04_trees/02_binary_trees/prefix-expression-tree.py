@@ -7,6 +7,7 @@ class Stack:
         return self.elements.pop()
 
 class TreeNode:
+    __slots__ = ('data', 'left', 'right')
     def __init__(self, data=None):
         self.data = data
         self.left = None
@@ -39,7 +40,14 @@ def build_tree_from_prefix(prefix_tokens):
             st.push(TreeNode(int(tok)))
     return st.pop()
 
-# Example
-prefix_expr = "* + 4 5 - 5 3".split()
-root = build_tree_from_prefix(prefix_expr)
-print(calc(root))  # -> 18
\ No newline at end of file
+
+if __name__ == "__main__":
+    # Example
+    prefix_expr = "* + 4 5 - 5 3".split()
+    root = build_tree_from_prefix(prefix_expr)
+    print(calc(root))  # -> 18
+
+    # The same expression compiled once into a flat stack-machine program
+    # from expression_compiler import compile_expression
+    # program = compile_expression("* + 4 5 - x 3", notation='prefix')
+    # print(program(x=5))  # -> 18
@@ -1,11 +1,23 @@
+import heapq
+import time
+import tracemalloc
+from array import array
+from bisect import bisect_left
+from random import Random
+
+
 class Node:
+    __slots__ = ('data', 'right_child', 'left_child', 'size')
     def __init__(self, data):
         self.data = data
         self.right_child = None
         self.left_child = None
+        self.size = 1   # nodes in the subtree rooted here
 
 
 class Tree:
+    node_class = Node
+
     def __init__(self):
         self.root_node = None
 
@@ -19,6 +31,7 @@ class Tree:
             parent = None
             while True:
                 parent = current
+                current.size += 1
                 if node.data < current.data:
                     current = current.left_child
                     if current is None:
@@ -63,6 +76,15 @@ class Tree:
             print("Not found:", data)
             return False
 
+        # Every node above the removed one loses a descendant
+        current = self.root_node
+        while current is not node:
+            current.size -= 1
+            if data < current.data:
+                current = current.left_child
+            else:
+                current = current.right_child
+
         # Count children
         left = node.left_child
         right = node.right_child
@@ -97,9 +119,11 @@ class Tree:
             return True
 
         # Case 2: two children
+        node.size -= 1
         parent_of_leftmost = node
         leftmost = node.right_child
         while leftmost.left_child:
+            leftmost.size -= 1
             parent_of_leftmost = leftmost
             leftmost = leftmost.left_child
 
@@ -127,12 +151,580 @@ class Tree:
         return current.data
 
     def in_order_traversal(self, root_node):
-        current = root_node
-        if current is None:
+        # Printing front end of in_order(), so deep trees do not hit the
+        # recursion limit.
+        if root_node is None:
             return
-        self.in_order_traversal(current.left_child)
-        print(current.data)
-        self.in_order_traversal(current.right_child)
+        for data in self.in_order(root_node):
+            print(data)
+
+    # Traversals as generators with an explicit stack. They start at the
+    # root unless given a node; __iter__ is the in-order one.
+    def in_order(self, root_node=None):
+        stack = []
+        current = root_node or self.root_node
+        while stack or current:
+            while current:
+                stack.append(current)
+                current = current.left_child
+            current = stack.pop()
+            yield current.data
+            current = current.right_child
+
+    __iter__ = in_order
+
+    def pre_order(self, root_node=None):
+        root_node = root_node or self.root_node
+        stack = [root_node] if root_node else []
+        while stack:
+            node = stack.pop()
+            yield node.data
+            if node.right_child:
+                stack.append(node.right_child)
+            if node.left_child:
+                stack.append(node.left_child)
+
+    def post_order(self, root_node=None):
+        stack = []
+        current = root_node or self.root_node
+        last_visited = None
+        while stack or current:
+            if current:
+                stack.append(current)
+                current = current.left_child
+            else:
+                node = stack[-1]
+                if node.right_child and last_visited is not node.right_child:
+                    current = node.right_child
+                else:
+                    yield node.data
+                    last_visited = stack.pop()
+
+    def morris_in_order(self):
+        """In-order with O(1) extra space, by threading the tree.
+
+        The rightmost node of each left subtree temporarily points back to
+        its successor. Do not modify the tree while iterating; closing the
+        generator early still removes every temporary link.
+        """
+        current = self.root_node
+        closed = False
+        while current:
+            if current.left_child is None:
+                if not closed:
+                    try:
+                        yield current.data
+                    except GeneratorExit:
+                        closed = True
+                current = current.right_child
+                continue
+            predecessor = current.left_child
+            while predecessor.right_child \
+                    and predecessor.right_child is not current:
+                predecessor = predecessor.right_child
+            if predecessor.right_child is None:
+                predecessor.right_child = current
+                current = current.left_child
+            else:
+                predecessor.right_child = None
+                if not closed:
+                    try:
+                        yield current.data
+                    except GeneratorExit:
+                        closed = True
+                current = current.right_child
+
+    def __contains__(self, data):
+        # search() without the printing
+        current = self.root_node
+        while current is not None:
+            if current.data == data:
+                return True
+            current = current.left_child if data < current.data \
+                else current.right_child
+        return False
+
+    def __len__(self):
+        return self.root_node.size if self.root_node else 0
+
+    # Order statistics. Every node knows the size of its subtree, so the
+    # k-th key and the rank of a key are found on one root-to-leaf walk.
+    def select(self, k):
+        """The k-th smallest key, counting from 0 like a sorted list."""
+        size = len(self)
+        if k < 0:
+            k += size
+        if not 0 <= k < size:
+            raise IndexError("tree index out of range")
+        current = self.root_node
+        while True:
+            left = current.left_child.size if current.left_child else 0
+            if k < left:
+                current = current.left_child
+            elif k == left:
+                return current.data
+            else:
+                k -= left + 1
+                current = current.right_child
+
+    def rank(self, data):
+        """How many keys are smaller than data."""
+        rank = 0
+        current = self.root_node
+        while current is not None:
+            if data <= current.data:
+                current = current.left_child
+            else:
+                rank += 1 + (current.left_child.size
+                             if current.left_child else 0)
+                current = current.right_child
+        return rank
+
+    def range(self, lo, hi):
+        """Yield the keys in [lo, hi] in order, lazily.
+
+        Subtrees that lie wholly below lo are never entered and the walk
+        stops at the first key above hi, so this costs O(log n + k).
+        """
+        stack = []
+        current = self.root_node
+        while stack or current is not None:
+            while current is not None:
+                if current.data < lo:
+                    current = current.right_child
+                else:
+                    stack.append(current)
+                    current = current.left_child
+            if not stack:
+                return
+            node = stack.pop()
+            if node.data > hi:
+                return
+            yield node.data
+            current = node.right_child
+
+    def height(self):
+        """Number of levels, counted level by level (no recursion)."""
+        level = [self.root_node] if self.root_node else []
+        height = 0
+        while level:
+            height += 1
+            level = [child for node in level
+                     for child in (node.left_child, node.right_child) if child]
+        return height
+
+    # Bulk loading. The middle key of a sorted run becomes the root and the
+    # two halves become its subtrees, so n keys give a perfectly balanced
+    # tree in O(n), with no comparisons on the way down.
+    @staticmethod
+    def _update(node):
+        node.size = 1 + (node.left_child.size if node.left_child else 0) \
+            + (node.right_child.size if node.right_child else 0)
+
+    @classmethod
+    def from_sorted(cls, iterable):
+        """Balanced tree from keys already in ascending order."""
+        keys = list(iterable)
+        for i in range(len(keys) - 1):
+            if keys[i + 1] < keys[i]:
+                raise ValueError(f"keys not sorted at index {i + 1}")
+        make_node = cls.node_class
+        update = cls._update
+
+        def build(lo, hi):
+            # depth is log2(n), so recursion is safe here
+            if lo >= hi:
+                return None
+            mid = (lo + hi) // 2
+            node = make_node(keys[mid])
+            node.left_child = build(lo, mid)
+            node.right_child = build(mid + 1, hi)
+            update(node)
+            return node
+
+        tree = cls()
+        tree.root_node = build(0, len(keys))
+        return tree
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        """Balanced tree from keys in any order: sort, then bulk load."""
+        return cls.from_sorted(sorted(iterable))
+
+    def freeze(self, values=None, typecode=None):
+        """Read-only FrozenTree snapshot of the keys (see FrozenTree).
+
+        values, if given, maps each key to the value stored alongside it.
+        """
+        return FrozenTree(self.in_order(), values, typecode)
+
+    def merge(self, other_tree):
+        """New balanced tree holding the keys of both trees.
+
+        The two in-order streams are merged like the merge step of merge
+        sort and loaded with from_sorted: O(n + m), and neither tree is
+        changed.
+        """
+        return type(self).from_sorted(
+            heapq.merge(self.in_order(), other_tree.in_order()))
+
+
+# Self-balancing (AVL) version of Tree. Every node stores the height of
+# its subtree; after an insert or remove the heights are fixed on the way
+# back up the search path and any node whose subtrees differ in height by
+# more than one is rotated back into balance. The height stays below
+# 1.44 log2(n), so sorted input no longer turns the tree into a list.
+# search, find_min and find_max are inherited unchanged.
+class AVLNode(Node):
+    __slots__ = ('height',)
+    def __init__(self, data):
+        super().__init__(data)
+        self.height = 1
+
+
+def node_height(node):
+    return node.height if node is not None else 0
+
+
+class AVLTree(Tree):
+    node_class = AVLNode
+
+    @staticmethod
+    def _update(node):
+        left = node_height(node.left_child)
+        right = node_height(node.right_child)
+        node.height = (left if left > right else right) + 1
+        node.size = 1 + (node.left_child.size if node.left_child else 0) \
+            + (node.right_child.size if node.right_child else 0)
+
+    @classmethod
+    def _rotate_right(cls, node):
+        pivot = node.left_child
+        node.left_child = pivot.right_child
+        pivot.right_child = node
+        cls._update(node)
+        cls._update(pivot)
+        return pivot
+
+    @classmethod
+    def _rotate_left(cls, node):
+        pivot = node.right_child
+        node.right_child = pivot.left_child
+        pivot.left_child = node
+        cls._update(node)
+        cls._update(pivot)
+        return pivot
+
+    @classmethod
+    def _rebalance(cls, node):
+        """Fix node's height; return the root of the balanced subtree.
+
+        insert and remove adjust the sizes along the path themselves, so
+        only the nodes moved by a rotation (_update) recompute theirs.
+        """
+        left = node_height(node.left_child)
+        right = node_height(node.right_child)
+        node.height = (left if left > right else right) + 1
+        balance = left - right
+        if balance > 1:
+            left = node.left_child
+            if node_height(left.left_child) < node_height(left.right_child):
+                node.left_child = cls._rotate_left(left)
+            return cls._rotate_right(node)
+        if balance < -1:
+            right = node.right_child
+            if node_height(right.right_child) < node_height(right.left_child):
+                node.right_child = cls._rotate_right(right)
+            return cls._rotate_left(node)
+        return node
+
+    def _rebalance_path(self, path):
+        # path runs from the root down to the parent of the changed spot
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i]
+            old_height = node.height
+            subtree = self._rebalance(node)
+            if subtree is not node:
+                if i == 0:
+                    self.root_node = subtree
+                elif path[i - 1].left_child is node:
+                    path[i - 1].left_child = subtree
+                else:
+                    path[i - 1].right_child = subtree
+            elif node.height == old_height:
+                break   # nothing above this node can have changed
+
+    def insert(self, data):
+        node = AVLNode(data)
+        if self.root_node is None:
+            self.root_node = node
+            return self.root_node
+        path = []
+        current = self.root_node
+        while current is not None:
+            path.append(current)
+            current.size += 1
+            if data < current.data:
+                current = current.left_child
+            else:
+                current = current.right_child
+        parent = path[-1]
+        if data < parent.data:
+            parent.left_child = node
+        else:
+            parent.right_child = node
+        self._rebalance_path(path)
+        return self.root_node
+
+    def remove(self, data):
+        path = []
+        current = self.root_node
+        while current is not None and current.data != data:
+            path.append(current)
+            if data < current.data:
+                current = current.left_child
+            else:
+                current = current.right_child
+        if current is None:
+            print("Not found:", data)
+            return False
+
+        # Two children: take over the data of the leftmost node of the
+        # right subtree and remove that node instead.
+        if current.left_child and current.right_child:
+            path.append(current)
+            leftmost = current.right_child
+            while leftmost.left_child:
+                path.append(leftmost)
+                leftmost = leftmost.left_child
+            current.data = leftmost.data
+            current = leftmost
+
+        child = current.left_child or current.right_child
+        if not path:
+            self.root_node = child
+        elif path[-1].left_child is current:
+            path[-1].left_child = child
+        else:
+            path[-1].right_child = child
+        for node in path:
+            node.size -= 1
+        self._rebalance_path(path)
+        return True
+
+
+# Read-only snapshot for search-heavy workloads. The keys are stored in
+# Eytzinger order: the BFS order of a perfectly balanced tree, so the
+# children of slot i are slots 2i and 2i+1 and there are no node objects
+# or child pointers at all. Slot 0 is unused. The top levels that every
+# search goes through sit next to each other at the front of the array.
+class FrozenTree:
+    __slots__ = ('keys', 'values', 'size')
+
+    def __init__(self, sorted_keys, values=None, typecode=None):
+        ordered = list(sorted_keys)
+        self.size = n = len(ordered)
+        slots = [None] * (n + 1)
+        # Give the slots an in-order walk of the implicit tree: filled in
+        # that order, the sorted keys end up in BFS layout.
+        stack = []
+        slot = 1
+        for key in ordered:
+            while slot <= n:
+                stack.append(slot)
+                slot *= 2
+            slot = stack.pop()
+            slots[slot] = key
+            slot = slot * 2 + 1
+        if typecode:
+            slots[0] = 0
+            slots = array(typecode, slots)
+        self.keys = slots
+        self.values = None
+        if values is not None:
+            self.values = [None] + [values[slots[i]] for i in range(1, n + 1)]
+
+    def __len__(self):
+        return self.size
+
+    def _lower_bound(self, data):
+        """Slot of the first key >= data, or 0 if there is none."""
+        keys = self.keys
+        n = self.size
+        i = 1
+        # No if/else on the comparison: the bool is added to the index.
+        while i <= n:
+            i = 2 * i + (keys[i] < data)
+        # Going right adds a 1 bit. Dropping the trailing 1s and the 0
+        # before them goes back to the last place the search went left.
+        return i >> (~i & (i + 1)).bit_length()
+
+    def __contains__(self, data):
+        i = self._lower_bound(data)
+        return i != 0 and self.keys[i] == data
+
+    def get(self, data, default=None):
+        i = self._lower_bound(data)
+        if i == 0 or self.keys[i] != data:
+            return default
+        return self.values[i] if self.values is not None else data
+
+    def find_min(self):
+        if self.size == 0:
+            return None
+        return self.keys[1 << (self.size.bit_length() - 1)]
+
+    def find_max(self):
+        if self.size == 0:
+            return None
+        i = 1
+        while 2 * i + 1 <= self.size:
+            i = 2 * i + 1
+        return self.keys[i]
+
+
+def benchmark_balanced(n=10**6, unbalanced_limit=10_000, seed=1):
+    """Inserts and lookups for sorted, reverse and random keys.
+
+    The plain Tree needs O(n^2) steps for sorted input, so for those two
+    orders it only gets unbalanced_limit keys; the n column says so.
+    """
+    orders = {
+        'sorted': list(range(n)),
+        'reverse': list(range(n - 1, -1, -1)),
+    }
+    orders['random'] = orders['sorted'][:]
+    Random(seed).shuffle(orders['random'])
+    print(f"{'keys':<8} {'tree':<8} {'n':>9} {'height':>7} "
+          f"{'inserts/sec':>12} {'lookups/sec':>12}")
+    for order, keys in orders.items():
+        for tree_class in (Tree, AVLTree):
+            sample = keys
+            if tree_class is Tree and order != 'random':
+                sample = keys[:unbalanced_limit]
+            tree = tree_class()
+            start = time.perf_counter()
+            for key in sample:
+                tree.insert(key)
+            inserts = len(sample) / (time.perf_counter() - start)
+            start = time.perf_counter()
+            for key in sample:
+                key in tree
+            lookups = len(sample) / (time.perf_counter() - start)
+            print(f"{order:<8} {tree_class.__name__:<8} {len(sample):>9,} "
+                  f"{tree.height():>7} {inserts:>12,.0f} {lookups:>12,.0f}")
+
+
+def benchmark_order_statistics(n=10**5, queries=1_000, seed=1):
+    """select/rank/range against a full in-order walk plus filtering."""
+    rng = Random(seed)
+    tree = AVLTree()
+    for key in rng.sample(range(n * 10), n):
+        tree.insert(key)
+
+    def in_order_list():
+        # The full traversal, collected instead of printed
+        return list(tree.in_order())
+
+    ks = [rng.randrange(n) for _ in range(queries)]
+    keys = [rng.randrange(n * 10) for _ in range(queries)]
+    spans = [(lo, lo + 100) for lo in keys]     # about 10 keys each
+    cases = [
+        ('select(k)', lambda k: tree.select(k), ks),
+        ('  walk + index', lambda k: in_order_list()[k], ks),
+        ('rank(key)', lambda key: tree.rank(key), keys),
+        ('  walk + count', lambda key: sum(1 for x in in_order_list()
+                                           if x < key), keys),
+        ('list(range(lo, hi))', lambda s: list(tree.range(*s)), spans),
+        ('  walk + filter', lambda s: [x for x in in_order_list()
+                                       if s[0] <= x <= s[1]], spans),
+    ]
+    print(f"{n:,} keys")
+    for label, query, args in cases:
+        if label.startswith(' '):
+            args = args[:max(1, queries // 100)]   # O(n) per query
+        start = time.perf_counter()
+        for arg in args:
+            query(arg)
+        rate = len(args) / (time.perf_counter() - start)
+        print(f"{label:<22} {rate:>12,.0f} queries/sec")
+
+
+def benchmark_bulk_load(n=10**6, seed=1):
+    """Loading a sorted dump: insert per key vs from_sorted, and merge."""
+    keys = list(range(n))
+    shuffled = keys[:]
+    Random(seed).shuffle(shuffled)
+    cases = [
+        ('Tree.insert, shuffled keys', lambda: _insert_all(Tree(), shuffled)),
+        ('AVLTree.insert, sorted keys',
+         lambda: _insert_all(AVLTree(), keys)),
+        ('Tree.from_sorted', lambda: Tree.from_sorted(keys)),
+        ('AVLTree.from_sorted', lambda: AVLTree.from_sorted(keys)),
+        ('Tree.from_iterable, shuffled', lambda: Tree.from_iterable(shuffled)),
+    ]
+    print(f"{'load':<30} {'seconds':>8} {'height':>7}")
+    for label, load in cases:
+        start = time.perf_counter()
+        tree = load()
+        elapsed = time.perf_counter() - start
+        print(f"{label:<30} {elapsed:>8.2f} {tree.height():>7}")
+
+    evens = Tree.from_sorted(keys[::2])
+    odds = Tree.from_sorted(keys[1::2])
+    start = time.perf_counter()
+    merged = evens.merge(odds)
+    elapsed = time.perf_counter() - start
+    print(f"{'merge of two n/2 trees':<30} {elapsed:>8.2f} {merged.height():>7}")
+    start = time.perf_counter()
+    _insert_all(AVLTree.from_sorted(keys[::2]), keys[1::2])
+    elapsed = time.perf_counter() - start
+    print(f"{'  AVLTree.insert of the other':<30} {elapsed:>8.2f}")
+
+
+def _insert_all(tree, keys):
+    for key in keys:
+        tree.insert(key)
+    return tree
+
+
+def benchmark_frozen(n=10**6, lookups=10**6, seed=1):
+    """Lookups/sec: linked Tree vs FrozenTree vs bisect on a sorted list."""
+    rng = Random(seed)
+    keys = sorted(rng.sample(range(2 * n), n))
+    queries = [rng.randrange(2 * n) for _ in range(lookups)]   # ~half hit
+
+    def traced(build):
+        # bytes of the structure itself; the key objects already exist
+        tracemalloc.start()
+        built = build()
+        used, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return built, used / n
+
+    tree, tree_bytes = traced(lambda: Tree.from_sorted(keys))
+    frozen, frozen_bytes = traced(tree.freeze)
+    frozen_array, array_bytes = traced(lambda: tree.freeze(typecode='q'))
+    sorted_keys, list_bytes = traced(lambda: list(keys))
+
+    def in_sorted_list(data):
+        i = bisect_left(sorted_keys, data)
+        return i != n and sorted_keys[i] == data
+
+    cases = [
+        ('linked Tree (in)', tree.__contains__, tree_bytes),
+        ('FrozenTree', frozen.__contains__, frozen_bytes),
+        ("FrozenTree typecode='q'", frozen_array.__contains__, array_bytes),
+        ('bisect on sorted list', in_sorted_list, list_bytes),
+    ]
+    print(f"{n:,} keys, {lookups:,} lookups")
+    print(f"{'':<26} {'lookups/sec':>12} {'bytes/key':>10}")
+    for label, contains, per_key in cases:
+        start = time.perf_counter()
+        sum(map(contains, queries))
+        elapsed = time.perf_counter() - start
+        print(f"{label:<26} {lookups / elapsed:>12,.0f} {per_key:>10.1f}")
+
 
 # tree = Tree()
 # r = tree.insert(5)
@@ -166,12 +758,63 @@ class Tree:
 # tree.search(9)
 
 
-#  Find min
-tree = Tree()
-tree.insert(5)
-tree.insert(2)
-tree.insert(7)
-tree.insert(9)
-tree.insert(1)
-print(tree.find_min())
-print(tree.find_max())
\ No newline at end of file
+if __name__ == "__main__":
+    #  Find min
+    tree = Tree()
+    tree.insert(5)
+    tree.insert(2)
+    tree.insert(7)
+    tree.insert(9)
+    tree.insert(1)
+    print(tree.find_min())
+    print(tree.find_max())
+
+
+
+    # Sorted keys into the balanced tree
+    # tree = AVLTree()
+    # for key in range(1, 8):
+    #     tree.insert(key)
+    # print(tree.root_node.data, tree.height())   # -> 4 3
+    # tree.remove(4)
+    # print(tree.find_min(), tree.find_max(), tree.search(5))
+
+
+    # Height and ops/sec against the plain Tree (10^6 keys)
+    # benchmark_balanced()
+
+
+    # k-th smallest, rank and range queries
+    # tree = AVLTree()
+    # for key in (50, 20, 70, 10, 30, 60, 80):
+    #     tree.insert(key)
+    # print(tree.select(0), tree.select(3), tree.rank(65), list(tree.range(25, 65)))
+    # # -> 10 50 5 [30, 50, 60]
+
+    # Order-statistic queries against a full traversal
+    # benchmark_order_statistics()
+
+    # Traversals as data: sorted keys from a tree far deeper than the
+    # recursion limit
+    # tree = Tree()
+    # for key in range(5_000):
+    #     tree.insert(key)
+    # print(sum(tree), list(tree.pre_order())[:3], next(tree.morris_in_order()))
+
+    # Nightly rebuild from a sorted dump, and merging two trees
+    # tree = Tree.from_sorted(range(1, 8))
+    # print(tree.root_node.data, tree.height(), len(tree))   # -> 4 3 7
+    # other = Tree.from_iterable([10, 0, 5])
+    # print(list(tree.merge(other)))   # -> [0, 1, 2, 3, 4, 5, 5, 6, 7, 10]
+
+    # Bulk load against n inserts
+    # benchmark_bulk_load()
+
+    # Frozen snapshot with values
+    # tree = Tree.from_iterable([40, 10, 30, 20])
+    # frozen = tree.freeze(values={10: 'ten', 20: 'twenty', 30: 'thirty', 40: 'forty'})
+    # print(frozen.keys[1:], 30 in frozen, frozen.get(20), frozen.get(25, '-'))
+    # # -> [30, 20, 40, 10] True twenty -
+
+    # Lookups against the linked Tree and bisect
+    # benchmark_frozen()
@@ -1,5 +1,6 @@
 # class for Node with data and priority
 class Node:
+    __slots__ = ('info', 'priority')
     def __init__(self, info, priority):
         self.info = info
         self.priority = priority
@@ -38,14 +39,13 @@ class PriorityQueue:
             print(f"{str(x.info)} - {x.priority}")
 
 
-    
-p = PriorityQueue()
-p.insert(Node("Cat", 13))
-p.insert(Node("Bat", 2))
-p.insert(Node("Rat", 1))
-p.insert(Node("Ant", 26))
-p.insert(Node("Lion", 25))
-p.show()
-p.delete()
-p.show()
-    
\ No newline at end of file
+if __name__ == "__main__":
+    p = PriorityQueue()
+    p.insert(Node("Cat", 13))
+    p.insert(Node("Bat", 2))
+    p.insert(Node("Rat", 1))
+    p.insert(Node("Ant", 26))
+    p.insert(Node("Lion", 25))
+    p.show()
+    p.delete()
+    p.show()
@@ -1,5 +1,6 @@
 # BST Node
 class BSTNode:
+    __slots__ = ('key', 'value', 'left', 'right')
     def __init__(self, key, value=None):
         self.key = key
         self.value = value
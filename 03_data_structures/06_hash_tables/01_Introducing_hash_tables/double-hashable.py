@@ -1,4 +1,5 @@
 class HashItem:
+    __slots__ = ('key', 'value')
     def __init__(self, key, value):
         self.key = key
         self.value = value
@@ -79,27 +80,28 @@ class HashTable:
         return self.get_double_hashing(key)
 
 
-ht = HashTable()
-ht.put_double_hashing("good", "eggs")
-ht.put_double_hashing("better", "spam")
-ht.put_double_hashing("best", "cool")
-ht.put_double_hashing("ad", "donot")
-ht.put_double_hashing("ga", "collide")
-ht.put_double_hashing("awd", "hello")
-ht.put_double_hashing("addition", "ok")
-for key in ("good", "better", "best", "worst", "ad", "ga"):
- v = ht.get_double_hashing(key)
- print(v)
-print("The number of elements is: {}".format(ht.count))
+if __name__ == "__main__":
+    ht = HashTable()
+    ht.put_double_hashing("good", "eggs")
+    ht.put_double_hashing("better", "spam")
+    ht.put_double_hashing("best", "cool")
+    ht.put_double_hashing("ad", "donot")
+    ht.put_double_hashing("ga", "collide")
+    ht.put_double_hashing("awd", "hello")
+    ht.put_double_hashing("addition", "ok")
+    for key in ("good", "better", "best", "worst", "ad", "ga"):
+     v = ht.get_double_hashing(key)
+     print(v)
+    print("The number of elements is: {}".format(ht.count))
 
 
 
 
-h = HashTable()
-h["c"] = "c"
-h["ax"] = "ax"
-h["aj"] = "aj"
-for key in ("c", "ax", "aj", "worst", "ad", "ga"):
-    v = h.get_double_hashing(key)
-    print(v)
-print("The number of elements is: {}".format(h.count))
+    h = HashTable()
+    h["c"] = "c"
+    h["ax"] = "ax"
+    h["aj"] = "aj"
+    for key in ("c", "ax", "aj", "worst", "ad", "ga"):
+        v = h.get_double_hashing(key)
+        print(v)
+    print("The number of elements is: {}".format(h.count))
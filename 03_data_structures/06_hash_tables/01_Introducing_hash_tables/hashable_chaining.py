@@ -1,4 +1,5 @@
 class Node:
+    __slots__ = ('key', 'value', 'next')
     def __init__(self, key=None, value=None):
         self.key = key
         self.value = value
@@ -68,22 +69,23 @@ class HashTableChaining:
             self.slots[x].traverse()
 
 
-ht = HashTableChaining()
-ht.put("good", "eggs")
-ht.put("better", "ham")
-ht.put("best", "spam")
-ht.put("ad", "do not")
-ht.put("ga", "collide")
-ht.put("awd", "do not")
+if __name__ == "__main__":
+    ht = HashTableChaining()
+    ht.put("good", "eggs")
+    ht.put("better", "ham")
+    ht.put("best", "spam")
+    ht.put("ad", "do not")
+    ht.put("ga", "collide")
+    ht.put("awd", "do not")
 
 
-v = ht.get("ad")
-print(v)
+    v = ht.get("ad")
+    print(v)
 
 
-for key in ("good", "better", "best", "worst", "ad", "ga"):
-    v = ht.get(key)
-    print(v)
+    for key in ("good", "better", "best", "worst", "ad", "ga"):
+        v = ht.get(key)
+        print(v)
 
 
-ht.printHashTable()
+    ht.printHashTable()
@@ -1,4 +1,5 @@
 class HashItem:
+    __slots__ = ('key', 'value')
     def __init__(self, key, value):
         self.key = key
         self.value = value
@@ -77,20 +78,21 @@ class HashTable:
 # ht.check_growth()
 
 
-# get key 
-ht = HashTable()
-# ht.put("good", "eggs")
-# ht.put("better", "ham")
-# ht.put("best", "spam")
-# ht.put("ad", "do not")
-# ht.put("ga", "collide")
-ht["good"] = "eggs"
-ht["better"] = "ham"
-ht["best"] = "spam"
-ht["ad"] = "do not"
-ht["ga"] = "collide"
+if __name__ == "__main__":
+    # get key 
+    ht = HashTable()
+    # ht.put("good", "eggs")
+    # ht.put("better", "ham")
+    # ht.put("best", "spam")
+    # ht.put("ad", "do not")
+    # ht.put("ga", "collide")
+    ht["good"] = "eggs"
+    ht["better"] = "ham"
+    ht["best"] = "spam"
+    ht["ad"] = "do not"
+    ht["ga"] = "collide"
 
-for key in ("good", "better", "best", "worst", "ad", "ga"):
-    v = v = ht[key]
-    print(f'"{key}": "{v}"')
-print("The number of elements is: {}".format(ht.count))
\ No newline at end of file
+    for key in ("good", "better", "best", "worst", "ad", "ga"):
+        v = v = ht[key]
+        print(f'"{key}": "{v}"')
+    print("The number of elements is: {}".format(ht.count))
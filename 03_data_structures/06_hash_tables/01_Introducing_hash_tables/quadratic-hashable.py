@@ -1,4 +1,5 @@
 class HashItem:
+    __slots__ = ('key', 'value')
     def __init__(self, key, value):
         self.key = key
         self.value = value
@@ -70,9 +71,10 @@ class HashTable:
         return self.get(key)
 
 
-ht = HashTable()
-ht.put_quadratic("good", "eggs")
-ht.put_quadratic("ad", "packt")
-ht.put_quadratic("ga", "books")
-v = ht.get_quadratic("ga")
-print(v) 
\ No newline at end of file
+if __name__ == "__main__":
+    ht = HashTable()
+    ht.put_quadratic("good", "eggs")
+    ht.put_quadratic("ad", "packt")
+    ht.put_quadratic("ga", "books")
+    v = ht.get_quadratic("ga")
+    print(v) 
@@ -0,0 +1,96 @@
+"""Bytes per element for every node class, dict-backed vs __slots__.
+
+Each node class in the data-structure modules declares __slots__. This
+script imports those modules by path (their demos sit under
+`if __name__ == "__main__":`, so none of them runs) and measures N
+instances of the slotted class against a dict-backed twin carrying the
+same attributes, i.e. the layout the classes had before __slots__.
+
+Run it from anywhere:  python node_memory_profile.py
+"""
+import importlib.util
+import tracemalloc
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+
+NODE_CLASSES = [
+    ('02_linked_list/02_linked_list/01_singly_linked_list/main.py',
+     ['Node', 'BackLinkedNode', 'UnrolledNode', 'SkipTower']),
+    ('02_linked_list/02_linked_list/02_doubly_linked_list/main.py',
+     ['Node', 'UnrolledNode']),
+    ('02_linked_list/02_linked_list/03_circular_linked_list/Circular_Singly_Link_List.py',
+     ['Node']),
+    ('02_linked_list/02_linked_list/03_circular_linked_list/Circular_Doubly_link_list.py',
+     ['Node']),
+    ('03_stack_and_queues/01_stack/linkedlist-base-stack.py', ['Node']),
+    ('03_stack_and_queues/02_application_of_stack/app.py', ['Node']),
+    ('03_stack_and_queues/03_queues/main.py', ['Node']),
+    ('03_stack_and_queues/04_applications_of_queue/main.py', ['Node']),
+    ('04_trees/02_binary_trees/main.py', ['Node']),
+    ('04_trees/02_binary_trees/postfix-expression-tree.py', ['TreeNode']),
+    ('04_trees/02_binary_trees/prefix-expression-tree.py', ['TreeNode']),
+    ('04_trees/03_binary_search_tree/main.py', ['Node']),
+    ('05_heaps_and_periority_queues/02_priority_queues/main.py', ['Node']),
+    ('06_hash_tables/01_Introducing_hash_tables/BST_hashable_chaining.py',
+     ['BSTNode']),
+    ('06_hash_tables/01_Introducing_hash_tables/hashable_chaining.py', ['Node']),
+    ('06_hash_tables/01_Introducing_hash_tables/linear-hashable.py',
+     ['HashItem']),
+    ('06_hash_tables/01_Introducing_hash_tables/quadratic-hashable.py',
+     ['HashItem']),
+    ('06_hash_tables/01_Introducing_hash_tables/double-hashable.py',
+     ['HashItem']),
+]
+
+
+def load_module(path):
+    """Import a module by path: names like linear-hashable are not importable."""
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def all_slots(cls):
+    slots = []
+    for klass in reversed(cls.__mro__):
+        slots.extend(klass.__dict__.get('__slots__', ()))
+    return slots
+
+
+def dict_backed_twin(cls):
+    return type(cls.__name__, (), {})
+
+
+def bytes_per_instance(cls, slots, n):
+    instances = [None] * n  # allocated before tracing starts
+    tracemalloc.start()
+    for i in range(n):
+        obj = cls.__new__(cls)
+        for name in slots:
+            setattr(obj, name, None)
+        instances[i] = obj
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return used / n
+
+
+def main(n=100_000):
+    print(f"{'module':<48} {'class':<15} {'dict':>6} {'slots':>6} {'saved':>6}")
+    for relative_path, class_names in NODE_CLASSES:
+        path = HERE / relative_path
+        module = f"{path.parent.name}/{path.name}"
+        loaded = load_module(path)
+        for name in class_names:
+            cls = getattr(loaded, name)
+            slots = all_slots(cls)
+            before = bytes_per_instance(dict_backed_twin(cls), slots, n)
+            after = bytes_per_instance(cls, slots, n)
+            saved = 1 - after / before
+            print(f"{module:<48} {name:<15} "
+                  f"{before:>6.1f} {after:>6.1f} {saved:>6.0%}")
+
+
+if __name__ == '__main__':
+    main()